@@ -14,7 +14,7 @@ from contextlib import asynccontextmanager
 import fitz          
 import docx
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Response, Depends
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, EmailStr
 from openai import OpenAI
@@ -29,7 +29,7 @@ from pathlib import Path
 from sqlmodel import Session, select
 from db import engine, init_db, InterviewSession, InterviewAnswer, JobDescription
 from services.embedding_service import generate_embedding, find_similar_answers
-from services.interview_orchestrator import InterviewOrchestrator
+from services.interview_orchestrator import InterviewOrchestrator, get_interview_orchestrator
 from services.conversation_context import (
     get_all_answers,
     build_conversation_summary,
@@ -2357,18 +2357,9 @@ async def search_interview_answers(request: SearchAnswersRequest):
 # -------------------- Phase 1.3: Intelligent Interview Flow Endpoints --------------------
 # These endpoints provide intelligent, context-aware question generation
 
-# Global orchestrator instance (lazy initialization)
-_orchestrator_instance: Optional[InterviewOrchestrator] = None
-
-
 def get_orchestrator() -> InterviewOrchestrator:
-    """Get/create the InterviewOrchestrator instance with lazy initialization."""
-    global _orchestrator_instance
-    if _orchestrator_instance is None:
-        logging.info("Initializing InterviewOrchestrator...")
-        _orchestrator_instance = InterviewOrchestrator()
-        logging.info("InterviewOrchestrator initialized successfully")
-    return _orchestrator_instance
+    """Get the shared InterviewOrchestrator instance (lazily initialized)."""
+    return get_interview_orchestrator()
 
 
 def validate_difficulty(difficulty: str) -> str:
@@ -2974,6 +2965,15 @@ async def serve_audio(filename: str):
     if not filename.endswith(".mp3"):
         raise HTTPException(status_code=400, detail="Only MP3 files are supported")
 
+    # Recently generated clips are served straight from memory
+    audio_bytes = get_tts_service().get_recent_audio(filename)
+    if audio_bytes is not None:
+        return Response(
+            content=audio_bytes,
+            media_type="audio/mpeg",
+            headers={"Cache-Control": "public, max-age=3600"}
+        )
+
     # Build file path
     audio_dir = Path("audio_cache")
     file_path = audio_dir / filename
@@ -2995,6 +2995,47 @@ async def serve_audio(filename: str):
     )
 
 
+@app.get("/api/tts/stream")
+async def stream_tts(
+    text: str,
+    context: str = "question",
+    conversation_stage: str = "mid",
+    voice: Optional[str] = None
+):
+    """
+    Stream Text-to-Speech audio while it is being synthesized.
+
+    Usable directly as an <audio> source: playback starts with the first
+    chunk instead of waiting for the whole clip, as /api/tts/generate does.
+
+    Query params:
+    - text: The text to convert (required, 1-4096 chars)
+    - context: Type of content (question, acknowledgment, follow_up, etc.)
+    - conversation_stage: Interview stage (early, mid, late)
+    - voice: Voice override (alloy, echo, fable, onyx, nova, shimmer)
+
+    Returns:
+    - Chunked audio stream with Content-Type: audio/mpeg
+    """
+    if not text or len(text) > 4096:
+        raise HTTPException(status_code=400, detail="Text must be 1-4096 characters")
+
+    tts = get_tts()
+    if not tts.should_speak_this(text, context):
+        raise HTTPException(
+            status_code=400,
+            detail="Text should not be spoken (too long, system message, or code)"
+        )
+
+    logging.info(f"TTS stream request: {len(text)} chars, context={context}")
+
+    return StreamingResponse(
+        tts.stream_for_interview_context(text, context, conversation_stage, voice),
+        media_type="audio/mpeg",
+        headers={"Cache-Control": "no-store"}
+    )
+
+
 class TTSBatchRequest(BaseModel):
     """Request model for batch TTS generation."""
     items: List[Dict[str, str]] = Field(
@@ -45,6 +45,8 @@ from .interview_decision_engine import (
 )
 from .interview_orchestrator import (
     InterviewOrchestrator,
+    get_interview_orchestrator,
+    reset_interview_orchestrator,
     get_orchestrated_question
 )
 from .question_selector import (
@@ -99,6 +101,8 @@ __all__ = [
     "InterviewDecisionEngine",
     "decide_interview_action",
     "InterviewOrchestrator",
+    "get_interview_orchestrator",
+    "reset_interview_orchestrator",
     "get_orchestrated_question",
     "QuestionSelector",
     "get_question_selector",
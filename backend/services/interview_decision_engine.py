@@ -8,6 +8,7 @@ to make intelligent decisions about interview flow.
 """
 
 import logging
+import re
 from typing import Dict, List, Optional, Tuple, Any
 from uuid import UUID
 
@@ -27,6 +28,43 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one alternation that matches any of them as a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Answer-quality keyword groups, compiled once so each group is a single scan
+_SITUATION_RE = _keyword_pattern([
+    "when", "while", "during", "at my", "in my role", "situation",
+    "context", "background", "scenario"
+])
+_TASK_RE = _keyword_pattern([
+    "needed to", "had to", "responsible", "goal", "objective",
+    "task", "challenge", "problem", "assigned"
+])
+_ACTION_RE = _keyword_pattern([
+    "i did", "i created", "i built", "i led", "i developed",
+    "i implemented", "i designed", "i managed", "i wrote",
+    "i analyzed", "i coordinated", "my approach"
+])
+_RESULT_RE = _keyword_pattern([
+    "resulted", "achieved", "improved", "increased", "decreased",
+    "outcome", "success", "impact", "saved", "reduced", "delivered"
+])
+_METRICS_RE = _keyword_pattern([
+    "%", "percent", "million", "thousand", "hours", "days", "weeks",
+    "team of", "increased by", "reduced by", "saved", "$"
+])
+_SPECIFIC_TECH_RE = _keyword_pattern([
+    "python", "java", "javascript", "sql", "aws", "docker", "kubernetes",
+    "react", "node", "api", "database", "algorithm", "framework"
+])
+_VAGUE_PHRASES = (
+    "stuff", "things", "etc", "and so on", "kind of", "sort of",
+    "basically", "pretty much", "i guess", "maybe", "probably"
+)
+
+
 class InterviewDecisionEngine:
     """
     Decides what type of question to ask next based on conversation analysis.
@@ -501,8 +539,10 @@ class InterviewDecisionEngine:
                 return (False, None)
 
             # Build response data
+            # Normalize the ID once here so downstream consumers always get a UUID
+            past_answer_id = best_match.get("answer_id")
             past_answer_data = {
-                "answer_id": best_match.get("answer_id"),
+                "answer_id": UUID(past_answer_id) if isinstance(past_answer_id, str) else past_answer_id,
                 "question_id": best_match.get("question_id"),
                 "question_text": best_match.get("question_text", ""),
                 "answer_excerpt": best_match.get("user_answer", "")[:200],
@@ -542,23 +582,10 @@ class InterviewDecisionEngine:
         word_count = len(words)
 
         # STAR format detection
-        has_situation = any(kw in answer_lower for kw in [
-            "when", "while", "during", "at my", "in my role", "situation",
-            "context", "background", "scenario"
-        ])
-        has_task = any(kw in answer_lower for kw in [
-            "needed to", "had to", "responsible", "goal", "objective",
-            "task", "challenge", "problem", "assigned"
-        ])
-        has_action = any(kw in answer_lower for kw in [
-            "i did", "i created", "i built", "i led", "i developed",
-            "i implemented", "i designed", "i managed", "i wrote",
-            "i analyzed", "i coordinated", "my approach"
-        ])
-        has_result = any(kw in answer_lower for kw in [
-            "resulted", "achieved", "improved", "increased", "decreased",
-            "outcome", "success", "impact", "saved", "reduced", "delivered"
-        ])
+        has_situation = _SITUATION_RE.search(answer_lower) is not None
+        has_task = _TASK_RE.search(answer_lower) is not None
+        has_action = _ACTION_RE.search(answer_lower) is not None
+        has_result = _RESULT_RE.search(answer_lower) is not None
 
         # Build missing elements list
         missing_elements = []
@@ -578,14 +605,8 @@ class InterviewDecisionEngine:
 
         # Specificity detection
         has_numbers = any(char.isdigit() for char in answer)
-        has_metrics = any(kw in answer_lower for kw in [
-            "%", "percent", "million", "thousand", "hours", "days", "weeks",
-            "team of", "increased by", "reduced by", "saved", "$"
-        ])
-        has_specific_tech = any(kw in answer_lower for kw in [
-            "python", "java", "javascript", "sql", "aws", "docker", "kubernetes",
-            "react", "node", "api", "database", "algorithm", "framework"
-        ])
+        has_metrics = _METRICS_RE.search(answer_lower) is not None
+        has_specific_tech = _SPECIFIC_TECH_RE.search(answer_lower) is not None
 
         # Specificity score
         specificity_indicators = [has_numbers, has_metrics, has_specific_tech]
@@ -595,12 +616,8 @@ class InterviewDecisionEngine:
         if "for example" in answer_lower or "specifically" in answer_lower:
             specificity_score = min(specificity_score + 0.2, 1.0)
 
-        # Vagueness detection
-        vague_phrases = [
-            "stuff", "things", "etc", "and so on", "kind of", "sort of",
-            "basically", "pretty much", "i guess", "maybe", "probably"
-        ]
-        vague_count = sum(1 for phrase in vague_phrases if phrase in answer_lower)
+        # Vagueness detection (counts distinct phrases, so scanned individually)
+        vague_count = sum(1 for phrase in _VAGUE_PHRASES if phrase in answer_lower)
         is_vague = vague_count >= 2 or (word_count < 30 and vague_count >= 1)
 
         return {
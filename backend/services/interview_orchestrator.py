@@ -7,10 +7,19 @@ This is the brain of the interview system - it decides what question to ask,
 when to follow up, when to challenge, and how to maintain conversation flow.
 """
 
+import asyncio
+import functools
+import itertools
 import logging
+import os
+import sys
 import time
 import json
-from typing import Dict, List, Optional, Any
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from uuid import UUID
 from datetime import datetime, timezone
 
@@ -33,20 +42,142 @@ from services.interviewer_personality import (
 )
 from services.realtime_response_generator import (
     RealtimeResponseGenerator,
-    get_realtime_response_generator
+    get_realtime_response_generator,
+    is_silent_answer
 )
 from services.tts_service import (
     TTSService,
     get_tts_service
 )
 
-# Configure logging with detailed format
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Fallback realtime responses used when analysis fails. Copied on use (see
+# _copy_realtime_fallback) so callers can mutate their copy safely.
+_FALLBACK_REALTIME_RESPONSE: Dict[str, Any] = {
+    "acknowledgment": {
+        "text": "Thank you for sharing that.",
+        "should_speak": True,
+        "tone": "neutral"
+    },
+    "follow_up_probe": None,
+    "needs_clarification": False,
+    "should_proceed_to_next": True,
+    "response_delay_ms": 500,
+    "quality_metrics": None,
+    "action_taken": "fallback"
+}
+
+_ERROR_FALLBACK_REALTIME_RESPONSE: Dict[str, Any] = {
+    **_FALLBACK_REALTIME_RESPONSE,
+    "acknowledgment": {
+        "text": "Thank you.",
+        "should_speak": True,
+        "tone": "neutral"
+    },
+    "response_delay_ms": 300,
+    "action_taken": "error_fallback"
+}
+
+
+# Generic questions used when normal question generation fails
+_FALLBACK_QUESTIONS: Tuple[str, ...] = (
+    "Tell me about a challenging project you've worked on recently.",
+    "What technical skills are you most proud of developing?",
+    "Describe a situation where you had to learn something new quickly.",
+    "How do you approach problem-solving in your work?",
+    "Tell me about a time you worked effectively as part of a team.",
+    "What accomplishment in your career are you most proud of?",
+    "How do you stay current with industry trends and technologies?",
+    "Describe your experience with handling tight deadlines.",
+    "What's your approach to receiving and implementing feedback?",
+    "Where do you see yourself growing professionally?"
+)
+_FALLBACK_QUESTION_COUNT = len(_FALLBACK_QUESTIONS)
+
+# Constant acknowledgments spoken on fallback/error paths
+_TURN_ERROR_ACK_TEXT = "Thank you for that response."
+_FOLLOW_UP_ERROR_ACK_TEXT = "Thank you for that additional detail."
+_STATIC_TTS_TEXTS = frozenset({
+    _FALLBACK_REALTIME_RESPONSE["acknowledgment"]["text"],
+    _ERROR_FALLBACK_REALTIME_RESPONSE["acknowledgment"]["text"],
+    _TURN_ERROR_ACK_TEXT,
+    _FOLLOW_UP_ERROR_ACK_TEXT,
+})
+
+# Answer qualities that count as sufficient
+_GOOD_QUALITIES = frozenset(("excellent", "good"))
+
+# Fixed parts of the response returned when a turn fails; copied per response
+_ERROR_ACK_FIELDS: Dict[str, Any] = {"should_speak": True, "tone": "neutral"}
+_ERROR_FLOW_CONTROL: Dict[str, Any] = {
+    "should_proceed_to_next": True,
+    "needs_follow_up": False,
+    "quality_sufficient": True
+}
+
+# Short interviewer phrases in these contexts come from the personality's
+# template pools and recur across sessions, so their audio is reused. Question
+# text is LLM-generated and effectively unique, so it isn't cached.
+_PHRASE_AUDIO_CONTEXTS = frozenset({"acknowledgment", "transition", "follow_up"})
+
+# Follow-up probe rules, checked in order against the decision reason.
+# Each entry: (reason keyword, quality flag that also triggers it, probe args)
+_PROBE_RULES = (
+    ("brief", None, ("that point", "specific")),
+    ("specific", "is_vague", ("that example", "specific")),
+    ("contribution", None, ("your involvement", "role")),
+    ("result", None, ("that project", "result")),
+    ("process", None, ("your approach", "process")),
+)
+_DEFAULT_PROBE_ARGS = ("that", "specific")
+
+
+@functools.lru_cache(maxsize=256)
+def _conversation_stage(current_question_number: int, total_questions: int) -> str:
+    """Map question progress to an interview stage (memoized; inputs are tiny ints)."""
+    # Calculate progress percentage
+    progress = current_question_number / total_questions
+
+    if progress <= 0.3:  # First 30% (Q1-3 for 10 questions)
+        return "early"
+    elif progress >= 0.8:  # Last 20% (Q8+ for 10 questions)
+        return "late"
+    else:
+        return "mid"
+
+
+# Stage for each question number of the default 10-question interview
+# (index = question number, 0-10); matches _conversation_stage for total=10
+_STAGE_LUT_10: Tuple[str, ...] = (
+    "early", "early", "early", "early",
+    "mid", "mid", "mid", "mid",
+    "late", "late", "late",
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _session_str(session_id: UUID) -> str:
+    """String form of a session UUID (memoized; the same session recurs every turn)."""
+    return str(session_id)
+
+
+def _copy_realtime_fallback(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a fallback realtime response template, including its acknowledgment."""
+    return {**template, "acknowledgment": {**template["acknowledgment"]}}
+
+
+@dataclass(slots=True)
+class TurnContext:
+    """Per-turn parameters shared by the helpers that build one answer's response."""
+    session_id: UUID
+    role: str
+    difficulty: str
+    total_questions: int
+    generate_audio: bool
+    conversation_stage: str
+    voice: Optional[str] = None
+
 
 class InterviewOrchestrator:
     """
@@ -67,6 +198,35 @@ class InterviewOrchestrator:
     - EmbeddingService: Enables semantic search
     """
 
+    # Max embedding requests in flight across all sessions
+    MAX_CONCURRENT_EMBEDDINGS = 8
+
+    # Max sessions whose detected patterns are kept in memory
+    MAX_PATTERN_CACHE_SESSIONS = 256
+
+    # Max per-answer quality analyses kept in memory
+    MAX_QUALITY_CACHE_ENTRIES = 4096
+
+    # Max sessions whose running quality-metric sums are kept in memory
+    MAX_QUALITY_TOTALS_SESSIONS = 256
+
+    # Variants generated per fixed-argument transition/probe phrase
+    TEMPLATE_VARIANTS = 5
+
+    # Answer IDs generated per os.urandom draw
+    ANSWER_ID_POOL_SIZE = 256
+
+    # Max reusable phrase clips remembered across sessions
+    MAX_PHRASE_AUDIO_ENTRIES = 1024
+
+    # Max (context, text) speak decisions remembered
+    MAX_SHOULD_SPEAK_CACHE_ENTRIES = 2048
+
+    # Speculative next questions parked across a follow-up probe expire after
+    # this long (the candidate abandoned the session), and at most this many are kept
+    PREFETCH_TTL_SECONDS = 900
+    MAX_PREFETCH_ENTRIES = 256
+
     def __init__(
         self,
         question_generator: Optional[IntelligentQuestionGenerator] = None,
@@ -110,9 +270,61 @@ class InterviewOrchestrator:
         self.embedding_service = embedding_service_module
 
         # Track follow-up attempts per question to avoid infinite loops
-        self._follow_up_counts: Dict[str, int] = {}  # session_question_key -> count
+        self._follow_up_counts: Counter = Counter()  # (session_id, question_id) -> count
         self.MAX_FOLLOW_UPS = 1  # Max follow-up probes before proceeding
 
+        # Embedding calls are blocking HTTP requests; run them in worker threads
+        # and cap how many are in flight at once
+        self._embed_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_EMBEDDINGS)
+
+        # Last detected patterns per session, keyed by session id and tagged with
+        # the (answer count, latest answer id) they were computed from
+        self._patterns_cache: Dict[str, Tuple[Tuple[int, Optional[str]], Dict[str, Any]]] = {}
+
+        # Heuristic quality analysis per stored answer (answer_id -> quality dict).
+        # Stored answers never change, so each one is analyzed only once.
+        self._quality_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Running quality-metric sums per session:
+        # session_id -> (answers counted, last answer_id, total words, STAR answers, total specificity)
+        self._quality_totals: Dict[str, Tuple[int, Optional[str], int, int, float]] = {}
+
+        # Question generators per decision-engine action (unknown -> standard)
+        self._action_dispatch = {
+            "challenge": self._act_challenge,
+            "deep_dive": self._act_deep_dive,
+            "follow_up": self._act_follow_up,
+            "reference": self._act_reference,
+            "standard": self._act_standard
+        }
+
+        # Start generating the next question while the current answer is still
+        # being analyzed; discarded if the analysis decides to probe instead
+        self.speculative_next_question = True
+
+        # Pre-generated variants for fixed-argument personality phrases, cycled so
+        # consecutive turns never repeat: (kind, *args) -> iterator of strings
+        self._template_cache: Dict[Tuple[str, ...], Iterator[str]] = {}
+
+        # Pre-generated answer IDs (see _generate_answer_id)
+        self._answer_id_pool: List[str] = []
+
+        # tts_service.should_speak_this decisions: (context, text) -> bool
+        self._should_speak_cache: Dict[Tuple[str, str], bool] = {}
+
+        # LRU of audio URLs for recurring phrases, shared across sessions:
+        # (normalized text, context, stage, voice) -> audio_url
+        self._phrase_audio_cache: "OrderedDict[Tuple[str, str, str, Optional[str]], str]" = OrderedDict()
+
+        # Single-flight next-question generation: identical concurrent calls
+        # (double submits, retries, speculative + direct) share one task
+        self._inflight_questions: Dict[Tuple[Any, ...], asyncio.Task] = {}
+        self._inflight_waiters: Counter = Counter()
+
+        # Speculative next-question tasks kept across a follow-up probe, oldest first:
+        # session_id -> (next question number, task, time parked)
+        self._prefetch: Dict[UUID, Tuple[int, asyncio.Task, float]] = {}
+
         logger.info("InterviewOrchestrator initialized with all dependencies including TTS service")
 
     async def get_next_question(
@@ -145,19 +357,16 @@ class InterviewOrchestrator:
         Returns:
             Dict with question, interviewer_comment, references, and metadata
         """
-        start_time = time.time()
-        session_id_str = str(session_id)
+        start_time = time.perf_counter()
 
-        logger.info("=" * 60)
-        logger.info(f"ORCHESTRATOR: Getting next question for session {session_id_str}")
-        logger.info(f"Question #{current_question_number} | Role: {role} | Difficulty: {difficulty}")
-        logger.info("=" * 60)
+        logger.info("ORCHESTRATOR: Getting next question for session %s", session_id)
+        logger.info("Question #%s | Role: %s | Difficulty: %s", current_question_number, role, difficulty)
 
         try:
             # Step 1: Detect all patterns in conversation
             logger.info("Step 1: Detecting conversation patterns...")
             patterns = await self._detect_all_patterns(session_id)
-            logger.info(f"Patterns detected: {list(patterns.keys())}")
+            logger.info("Patterns detected: %s", list(patterns))
 
             # Step 2: Get decision from decision engine
             logger.info("Step 2: Getting decision from decision engine...")
@@ -168,11 +377,11 @@ class InterviewOrchestrator:
             )
 
             action = decision.get("action", "standard")
-            logger.info(f"Decision: {action} (Priority: {decision.get('priority', 'N/A')})")
-            logger.info(f"Reason: {decision.get('reason', 'N/A')}")
+            logger.info("Decision: %s (Priority: %s)", action, decision.get("priority", "N/A"))
+            logger.info("Reason: %s", decision.get("reason", "N/A"))
 
             # Step 3: Generate question based on decision
-            logger.info(f"Step 3: Generating {action} question...")
+            logger.info("Step 3: Generating %s question...", action)
             question_data = await self._generate_question_by_action(
                 session_id,
                 current_question_number,
@@ -182,7 +391,7 @@ class InterviewOrchestrator:
                 decision.get("data", {})
             )
 
-            logger.info(f"Generated question type: {question_data.get('question_type', 'N/A')}")
+            logger.info("Generated question type: %s", question_data.get("question_type", "N/A"))
 
             # Step 4: Build interviewer comment
             logger.info("Step 4: Building interviewer comment...")
@@ -192,7 +401,7 @@ class InterviewOrchestrator:
             )
 
             if interviewer_comment:
-                logger.info(f"Interviewer comment: {interviewer_comment[:50]}...")
+                logger.info("Interviewer comment: %.50s...", interviewer_comment)
             else:
                 logger.info("No interviewer comment needed")
 
@@ -207,15 +416,13 @@ class InterviewOrchestrator:
             )
 
             # Log execution time
-            execution_time = time.time() - start_time
-            logger.info(f"ORCHESTRATOR: Question generated in {execution_time:.2f}s")
-            logger.info("=" * 60)
+            execution_time = time.perf_counter() - start_time
+            logger.info("ORCHESTRATOR: Question generated in %.2fs", execution_time)
 
             return response
 
         except Exception as e:
-            logger.error(f"ORCHESTRATOR ERROR: {str(e)}")
-            logger.exception("Full traceback:")
+            logger.error("ORCHESTRATOR ERROR: %s", e, exc_info=True)
 
             # Return fallback question
             return await self._get_fallback_question(
@@ -254,13 +461,10 @@ class InterviewOrchestrator:
         Returns:
             Dict with answer_stored status, answer_id, realtime_response, and next_question
         """
-        start_time = time.time()
-        session_id_str = str(session_id)
+        start_time = time.perf_counter()
 
-        logger.info("=" * 60)
-        logger.info(f"ORCHESTRATOR: Processing answer and getting next question")
-        logger.info(f"Session: {session_id_str}")
-        logger.info("=" * 60)
+        logger.info("ORCHESTRATOR: Processing answer and getting next question")
+        logger.info("Session: %s", session_id)
 
         answer_id = None
         answer_stored = False
@@ -280,11 +484,11 @@ class InterviewOrchestrator:
             text_for_embedding = f"Question: {question_text}\nAnswer: {user_answer}"
 
             try:
-                embedding = generate_embedding(text_for_embedding)
+                embedding = await self._generate_embedding(text_for_embedding)
                 embedding_json = json.dumps(embedding)
                 logger.info("Embedding generated successfully")
             except Exception as embed_error:
-                logger.warning(f"Failed to generate embedding: {embed_error}")
+                logger.warning("Failed to generate embedding: %s", embed_error)
                 embedding_json = None
 
             # Store in database (this would typically call the API or db directly)
@@ -292,7 +496,7 @@ class InterviewOrchestrator:
             answer_id = self._generate_answer_id()
             answer_stored = True
 
-            logger.info(f"Answer stored with ID: {answer_id}")
+            logger.info("Answer stored with ID: %s", answer_id)
 
             # Step 2: Generate realtime response to the answer
             logger.info("Step 2: Generating realtime response...")
@@ -303,24 +507,12 @@ class InterviewOrchestrator:
                     question_id,
                     question_intent
                 )
-                logger.info(f"Realtime response generated: action={realtime_response.get('action_taken')}")
-                logger.info(f"Should proceed: {realtime_response.get('should_proceed_to_next')}")
+                logger.info("Realtime response generated: action=%s", realtime_response.get("action_taken"))
+                logger.info("Should proceed: %s", realtime_response.get("should_proceed_to_next"))
             except Exception as rt_error:
-                logger.warning(f"Failed to generate realtime response: {rt_error}")
+                logger.warning("Failed to generate realtime response: %s", rt_error)
                 # Fallback realtime response
-                realtime_response = {
-                    "acknowledgment": {
-                        "text": "Thank you for sharing that.",
-                        "should_speak": True,
-                        "tone": "neutral"
-                    },
-                    "follow_up_probe": None,
-                    "needs_clarification": False,
-                    "should_proceed_to_next": True,
-                    "response_delay_ms": 500,
-                    "quality_metrics": None,
-                    "action_taken": "fallback"
-                }
+                realtime_response = _copy_realtime_fallback(_FALLBACK_REALTIME_RESPONSE)
 
             # Step 3: Decide whether to proceed to next question
             should_proceed = realtime_response.get("should_proceed_to_next", True)
@@ -354,14 +546,13 @@ class InterviewOrchestrator:
                 "next_question": next_question
             }
 
-            execution_time = time.time() - start_time
-            logger.info(f"ORCHESTRATOR: Answer processed in {execution_time:.2f}s (proceed={should_proceed})")
+            execution_time = time.perf_counter() - start_time
+            logger.info("ORCHESTRATOR: Answer processed in %.2fs (proceed=%s)", execution_time, should_proceed)
 
             return response
 
         except Exception as e:
-            logger.error(f"ORCHESTRATOR ERROR in process_answer_and_get_next: {str(e)}")
-            logger.exception("Full traceback:")
+            logger.error("ORCHESTRATOR ERROR in process_answer_and_get_next: %s", e, exc_info=True)
 
             # Still try to return next question even if storage failed
             try:
@@ -385,19 +576,7 @@ class InterviewOrchestrator:
                 "answer_stored": False,
                 "answer_id": None,
                 "error": str(e),
-                "realtime_response": {
-                    "acknowledgment": {
-                        "text": "Thank you.",
-                        "should_speak": True,
-                        "tone": "neutral"
-                    },
-                    "follow_up_probe": None,
-                    "needs_clarification": False,
-                    "should_proceed_to_next": True,
-                    "response_delay_ms": 300,
-                    "quality_metrics": None,
-                    "action_taken": "error_fallback"
-                },
+                "realtime_response": _copy_realtime_fallback(_ERROR_FALLBACK_REALTIME_RESPONSE),
                 "should_proceed": True,
                 "next_question": next_question
             }
@@ -417,7 +596,7 @@ class InterviewOrchestrator:
         Returns:
             Dict with comprehensive conversation analysis
         """
-        session_id_str = str(session_id)
+        session_id_str = _session_str(session_id)
         logger.info(f"Analyzing conversation state for session {session_id_str}")
 
         try:
@@ -504,7 +683,7 @@ class InterviewOrchestrator:
         Returns:
             Dict with all detected patterns
         """
-        session_id_str = str(session_id)
+        session_id_str = _session_str(session_id)
         logger.info(f"Detecting all patterns for session {session_id_str}")
 
         patterns = {
@@ -523,6 +702,13 @@ class InterviewOrchestrator:
                 logger.info("No answers yet - no patterns to detect")
                 return patterns
 
+            # Nothing new answered since the last call (retry, reconnect, refetch)
+            answers_signature = (len(all_answers), all_answers[-1].get("answer_id"))
+            cached = self._patterns_cache.get(session_id_str)
+            if cached is not None and cached[0] == answers_signature:
+                logger.info("No new answers since last detection - reusing cached patterns")
+                return cached[1]
+
             # Detect repeated topics
             patterns["repeated_topics"] = detect_repeated_topics(session_id_str)
             logger.info(f"Repeated topics: {patterns['repeated_topics']}")
@@ -538,10 +724,7 @@ class InterviewOrchestrator:
 
             # Analyze answer quality to find weak answers
             for answer in all_answers:
-                quality = self.decision_engine._analyze_answer_quality(
-                    answer.get("user_answer", ""),
-                    answer.get("question_intent", "general")
-                )
+                quality = self._get_answer_quality(answer)
 
                 if quality["completeness_score"] < 0.4 or quality["is_vague"]:
                     patterns["weak_answers"].append(answer.get("question_id"))
@@ -566,12 +749,25 @@ class InterviewOrchestrator:
 
             logger.info(f"Gaps identified: {patterns['gaps']}")
 
+            self._cache_patterns(session_id_str, answers_signature, patterns)
             return patterns
 
         except Exception as e:
             logger.error(f"Error detecting patterns: {str(e)}")
             return patterns
 
+    def _cache_patterns(
+        self,
+        session_id_str: str,
+        answers_signature: Tuple[int, Optional[str]],
+        patterns: Dict[str, Any]
+    ) -> None:
+        """Remember detected patterns for a session, evicting the oldest session when full."""
+        self._patterns_cache.pop(session_id_str, None)
+        if len(self._patterns_cache) >= self.MAX_PATTERN_CACHE_SESSIONS:
+            self._patterns_cache.pop(next(iter(self._patterns_cache)))
+        self._patterns_cache[session_id_str] = (answers_signature, patterns)
+
     async def _build_interviewer_comment(
         self,
         action_type: str,
@@ -682,37 +878,17 @@ class InterviewOrchestrator:
                 reason = action_data.get("reason", "")
                 quality = action_data.get("quality_analysis", {})
 
+                # Short answers always get the "brief" probe
+                if quality.get("word_count", 100) < 50:
+                    return self.personality.generate_probing_response(*_PROBE_RULES[0][2])
+
                 # Determine probe type based on what's missing
-                if "brief" in reason.lower() or quality.get("word_count", 100) < 50:
-                    return self.personality.generate_probing_response(
-                        "that point",
-                        "specific"
-                    )
-                elif "specific" in reason.lower() or quality.get("is_vague"):
-                    return self.personality.generate_probing_response(
-                        "that example",
-                        "specific"
-                    )
-                elif "contribution" in reason.lower():
-                    return self.personality.generate_probing_response(
-                        "your involvement",
-                        "role"
-                    )
-                elif "result" in reason.lower():
-                    return self.personality.generate_probing_response(
-                        "that project",
-                        "result"
-                    )
-                elif "process" in reason.lower():
-                    return self.personality.generate_probing_response(
-                        "your approach",
-                        "process"
-                    )
-                else:
-                    return self.personality.generate_probing_response(
-                        "that",
-                        "specific"
-                    )
+                reason_lower = reason.lower()
+                for keyword, quality_flag, probe_args in _PROBE_RULES:
+                    if keyword in reason_lower or (quality_flag and quality.get(quality_flag)):
+                        return self.personality.generate_probing_response(*probe_args)
+
+                return self.personality.generate_probing_response(*_DEFAULT_PROBE_ARGS)
 
             else:
                 return None
@@ -769,6 +945,10 @@ class InterviewOrchestrator:
         if patterns.get("weak_answers"):
             patterns_detected.append(f"weak_answers: Q{', Q'.join(map(str, patterns['weak_answers'][:3]))}")
 
+        # The same labels recur turn after turn within a session; intern them and
+        # store an immutable tuple (serializes as a JSON array like the list did)
+        patterns_detected = tuple(map(sys.intern, patterns_detected))
+
         # Build final response
         response = {
             "question": {
@@ -815,72 +995,124 @@ class InterviewOrchestrator:
         Returns:
             Question data from generator
         """
-        logger.info(f"Generating question for action: {action}")
-
-        try:
-            if action == "challenge":
-                contradiction = action_data.get("contradiction", {})
-                return await self.question_generator.generate_contradiction_challenge(
-                    session_id,
-                    contradiction
-                )
-
-            elif action == "deep_dive":
-                topic = action_data.get("topic", "")
-                count = action_data.get("mention_count", 3)
-                return await self.question_generator.generate_deep_dive_question(
-                    session_id,
-                    topic,
-                    count
-                )
+        logger.debug("Generating question for action: %s", action)
 
-            elif action == "follow_up":
-                last_answer = action_data.get("last_answer", "")
-                last_intent = action_data.get("last_question_intent", "general")
-                return await self.question_generator.generate_follow_up_question(
+        handler = self._action_dispatch.get(action)
+        if handler is not None:
+            try:
+                return await handler(
                     session_id,
-                    last_answer,
-                    last_intent
+                    current_question_number,
+                    role,
+                    difficulty,
+                    action_data
                 )
+            except Exception as e:
+                logger.error("Error generating question for action %s: %s", action, e)
+
+        # Unknown action or failed handler: fall back to a standard question
+        return await self._act_standard(
+            session_id,
+            current_question_number,
+            role,
+            difficulty,
+            action_data
+        )
 
-            elif action == "reference":
-                past_answer = action_data.get("past_answer", {})
-                topic = action_data.get("current_topic", past_answer.get("topic", ""))
-                answer_id = past_answer.get("answer_id")
+    async def _act_challenge(
+        self,
+        session_id: UUID,
+        current_question_number: int,
+        role: str,
+        difficulty: str,
+        action_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a question challenging a detected contradiction."""
+        contradiction = action_data.get("contradiction", {})
+        return await self.question_generator.generate_contradiction_challenge(
+            session_id,
+            contradiction
+        )
 
-                if answer_id:
-                    return await self.question_generator.generate_referencing_question(
-                        session_id,
-                        topic,
-                        UUID(answer_id) if isinstance(answer_id, str) else answer_id
-                    )
-                else:
-                    # Fallback to standard if no answer_id
-                    return await self.question_generator.generate_next_question(
-                        session_id,
-                        current_question_number,
-                        role,
-                        difficulty
-                    )
+    async def _act_deep_dive(
+        self,
+        session_id: UUID,
+        current_question_number: int,
+        role: str,
+        difficulty: str,
+        action_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a deep-dive question on a frequently mentioned topic."""
+        topic = action_data.get("topic", "")
+        count = action_data.get("mention_count", 3)
+        return await self.question_generator.generate_deep_dive_question(
+            session_id,
+            topic,
+            count
+        )
 
-            else:  # standard
-                return await self.question_generator.generate_next_question(
-                    session_id,
-                    current_question_number,
-                    role,
-                    difficulty
-                )
+    async def _act_follow_up(
+        self,
+        session_id: UUID,
+        current_question_number: int,
+        role: str,
+        difficulty: str,
+        action_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a follow-up question on the last answer."""
+        last_answer = action_data.get("last_answer", "")
+        last_intent = action_data.get("last_question_intent", "general")
+        return await self.question_generator.generate_follow_up_question(
+            session_id,
+            last_answer,
+            last_intent
+        )
 
-        except Exception as e:
-            logger.error(f"Error generating question for action {action}: {str(e)}")
-            # Fallback to standard question
-            return await self.question_generator.generate_next_question(
+    async def _act_reference(
+        self,
+        session_id: UUID,
+        current_question_number: int,
+        role: str,
+        difficulty: str,
+        action_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a question referencing a past answer."""
+        past_answer = action_data.get("past_answer", {})
+        topic = action_data.get("current_topic", past_answer.get("topic", ""))
+        answer_id = past_answer.get("answer_id")
+
+        if not answer_id:
+            # Fallback to standard if no answer_id
+            return await self._act_standard(
                 session_id,
                 current_question_number,
                 role,
-                difficulty
+                difficulty,
+                action_data
             )
 
+        return await self.question_generator.generate_referencing_question(
+            session_id,
+            topic,
+            answer_id if isinstance(answer_id, UUID) else UUID(str(answer_id))
+        )
+
+    async def _act_standard(
+        self,
+        session_id: UUID,
+        current_question_number: int,
+        role: str,
+        difficulty: str,
+        action_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a standard next question."""
+        return await self.question_generator.generate_next_question(
+            session_id,
+            current_question_number,
+            role,
+            difficulty
+        )
+
     async def _get_fallback_question(
         self,
         question_number: int,
@@ -900,24 +1132,10 @@ class InterviewOrchestrator:
         Returns:
             Fallback question response
         """
-        logger.warning(f"Using fallback question due to: {error_reason}")
-
-        fallback_questions = [
-            "Tell me about a challenging project you've worked on recently.",
-            "What technical skills are you most proud of developing?",
-            "Describe a situation where you had to learn something new quickly.",
-            "How do you approach problem-solving in your work?",
-            "Tell me about a time you worked effectively as part of a team.",
-            "What accomplishment in your career are you most proud of?",
-            "How do you stay current with industry trends and technologies?",
-            "Describe your experience with handling tight deadlines.",
-            "What's your approach to receiving and implementing feedback?",
-            "Where do you see yourself growing professionally?"
-        ]
+        logger.warning("Using fallback question due to: %s", error_reason)
 
         # Select question based on question number
-        question_index = (question_number - 1) % len(fallback_questions)
-        question_text = fallback_questions[question_index]
+        question_text = _FALLBACK_QUESTIONS[(question_number - 1) % _FALLBACK_QUESTION_COUNT]
 
         return {
             "question": {
@@ -933,7 +1151,7 @@ class InterviewOrchestrator:
             },
             "metadata": {
                 "decision_reason": f"Fallback due to error: {error_reason[:100]}",
-                "patterns_detected": [],
+                "patterns_detected": (),
                 "conversation_stage": "unknown",
                 "action_taken": "fallback",
                 "context_used": "Fallback question - no context available",
@@ -962,23 +1180,46 @@ class InterviewOrchestrator:
                 "specificity_score": 0
             }
 
+        num_answers = len(all_answers)
+        session_key = all_answers[0].get("session_id")
+
+        # Resume from the running totals of the previous call when the answers
+        # seen then are still a prefix of this list; only new answers are added
+        start = 0
         total_length = 0
         star_count = 0
         total_specificity = 0
 
-        for answer in all_answers:
-            answer_text = answer.get("user_answer", "")
-            quality = self.decision_engine._analyze_answer_quality(
-                answer_text,
-                answer.get("question_intent", "general")
-            )
-
+        cached = self._quality_totals.get(session_key)
+        if cached is not None:
+            count, last_answer_id, cached_length, cached_stars, cached_specificity = cached
+            if (
+                last_answer_id is not None
+                and count <= num_answers
+                and all_answers[count - 1].get("answer_id") == last_answer_id
+            ):
+                start = count
+                total_length = cached_length
+                star_count = cached_stars
+                total_specificity = cached_specificity
+
+        for answer in all_answers[start:]:
+            quality = self._get_answer_quality(answer)
             total_length += quality["word_count"]
-            if quality["has_star_format"]:
-                star_count += 1
+            star_count += quality["has_star_format"]
             total_specificity += quality["specificity_score"]
 
-        num_answers = len(all_answers)
+        if session_key is not None:
+            self._quality_totals.pop(session_key, None)
+            if len(self._quality_totals) >= self.MAX_QUALITY_TOTALS_SESSIONS:
+                self._quality_totals.pop(next(iter(self._quality_totals)))
+            self._quality_totals[session_key] = (
+                num_answers,
+                all_answers[-1].get("answer_id"),
+                total_length,
+                star_count,
+                total_specificity
+            )
 
         return {
             "avg_answer_length": round(total_length / num_answers, 1),
@@ -986,6 +1227,34 @@ class InterviewOrchestrator:
             "specificity_score": round(total_specificity / num_answers, 2)
         }
 
+    def _get_answer_quality(self, answer: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the heuristic quality analysis for a stored answer, analyzing it once.
+
+        Args:
+            answer: Answer dictionary from get_all_answers
+
+        Returns:
+            Quality dict from the decision engine
+        """
+        answer_id = answer.get("answer_id")
+        if answer_id is not None:
+            quality = self._quality_cache.get(answer_id)
+            if quality is not None:
+                return quality
+
+        quality = self.decision_engine._analyze_answer_quality(
+            answer.get("user_answer", ""),
+            answer.get("question_intent", "general")
+        )
+
+        if answer_id is not None:
+            if len(self._quality_cache) >= self.MAX_QUALITY_CACHE_ENTRIES:
+                self._quality_cache.pop(next(iter(self._quality_cache)))
+            self._quality_cache[answer_id] = quality
+
+        return quality
+
     def _generate_recommendations(
         self,
         all_answers: List[Dict],
@@ -1005,21 +1274,26 @@ class InterviewOrchestrator:
         Returns:
             List of recommendation strings
         """
-        recommendations = []
+        avg_answer_length = quality_metrics.get("avg_answer_length", 0)
+        star_format_usage = quality_metrics.get("star_format_usage", 0)
+        specificity_score = quality_metrics.get("specificity_score", 0)
+        num_answers = len(all_answers)
 
         # Topic-based recommendations
-        for topic, count in repeated_topics.items():
-            if count >= 3:
-                recommendations.append(f"Candidate is passionate about {topic} (mentioned {count} times)")
+        recommendations = [
+            f"Candidate is passionate about {topic} (mentioned {count} times)"
+            for topic, count in repeated_topics.items()
+            if count >= 3
+        ]
 
         # Quality-based recommendations
-        if quality_metrics.get("avg_answer_length", 0) < 50:
+        if avg_answer_length < 50:
             recommendations.append("Candidate gives brief answers - consider more follow-up questions")
 
-        if quality_metrics.get("star_format_usage", 0) < 0.3:
+        if star_format_usage < 0.3:
             recommendations.append("Candidate rarely uses STAR format - may need prompting for specific examples")
 
-        if quality_metrics.get("specificity_score", 0) < 0.4:
+        if specificity_score < 0.4:
             recommendations.append("Answers tend to be vague - ask for concrete examples and metrics")
 
         # Contradiction recommendations
@@ -1027,8 +1301,8 @@ class InterviewOrchestrator:
             recommendations.append(f"Detected {len(contradictions)} potential inconsistency(ies) - consider clarifying")
 
         # General progress
-        if len(all_answers) >= 5:
-            recommendations.append(f"Good progress: {len(all_answers)} questions answered")
+        if num_answers >= 5:
+            recommendations.append(f"Good progress: {num_answers} questions answered")
 
         return recommendations
 
@@ -1062,13 +1336,13 @@ class InterviewOrchestrator:
         Returns:
             Comprehensive response with ai_response, next_question, and flow_control
         """
-        start_time = time.time()
-        session_id_str = str(session_id)
+        start_time = time.perf_counter()
+        session_id_str = _session_str(session_id)
 
-        logger.info("=" * 60)
-        logger.info("ORCHESTRATOR: Processing answer with realtime response")
-        logger.info(f"Session: {session_id_str} | Audio: {generate_audio}")
-        logger.info("=" * 60)
+        logger.debug(
+            "ORCHESTRATOR: Processing answer with realtime response (session=%s audio=%s)",
+            session_id_str, generate_audio
+        )
 
         # Extract answer data
         question_id = answer_data.get("question_id", 0)
@@ -1076,55 +1350,77 @@ class InterviewOrchestrator:
         question_intent = answer_data.get("question_intent", "behavioral")
         user_answer = answer_data.get("user_answer", "")
 
-        # Determine conversation stage
+        # Determine conversation stage once for the whole turn
         conversation_stage = self._determine_conversation_stage(question_id, total_questions)
-        logger.info(f"Conversation stage: {conversation_stage}")
+        logger.debug("Conversation stage: %s", conversation_stage)
+        ctx = TurnContext(
+            session_id, role, difficulty, total_questions,
+            generate_audio, conversation_stage, voice
+        )
+
+        # Speculatively generate the next question alongside answer analysis.
+        # If the analysis asks for a follow-up probe instead, the task is kept
+        # for handle_follow_up_answer, which always proceeds to this question.
+        next_question_number = question_id + 1
+        speculative_question = self._take_prefetched_question(session_id, next_question_number)
+        if (
+            speculative_question is None
+            and self.speculative_next_question
+            and next_question_number <= total_questions
+        ):
+            speculative_question = asyncio.create_task(
+                self.generate_question_with_audio(
+                    session_id,
+                    next_question_number,
+                    role,
+                    difficulty,
+                    total_questions,
+                    generate_audio,
+                    voice
+                )
+            )
 
         try:
-            # Step 1: Store the answer with embedding
-            logger.info("Step 1: Storing answer...")
-            answer_id = None
-            answer_stored = False
+            # Steps 1-2: Embed the answer and analyze its quality concurrently;
+            # neither depends on the other.
+            logger.debug("Steps 1-2: Storing answer and analyzing quality...")
+            text_for_embedding = f"Question: {question_text}\nAnswer: {user_answer}"
+            embedding, realtime_response = await asyncio.gather(
+                self._generate_embedding(text_for_embedding),
+                self.realtime_generator.generate_post_answer_response(
+                    session_id,
+                    user_answer,
+                    question_id,
+                    question_intent,
+                    difficulty=difficulty
+                ),
+                return_exceptions=True
+            )
+            if isinstance(realtime_response, BaseException):
+                raise realtime_response
 
-            try:
-                text_for_embedding = f"Question: {question_text}\nAnswer: {user_answer}"
-                embedding = generate_embedding(text_for_embedding)
+            answer_id = self._generate_answer_id()
+            answer_stored = True
+            if isinstance(embedding, BaseException):
+                logger.warning("Failed to store answer with embedding: %s", embedding)
+            else:
                 embedding_json = json.dumps(embedding)
-                answer_id = self._generate_answer_id()
-                answer_stored = True
-                logger.info(f"Answer stored with ID: {answer_id}")
-            except Exception as embed_error:
-                logger.warning(f"Failed to store answer with embedding: {embed_error}")
-                answer_id = self._generate_answer_id()
-                answer_stored = True
-
-            # Step 2: Analyze answer quality using RealtimeResponseGenerator
-            logger.info("Step 2: Analyzing answer quality...")
-            realtime_response = await self.realtime_generator.generate_post_answer_response(
-                session_id,
-                user_answer,
-                question_id,
-                question_intent,
-                difficulty=difficulty
-            )
+                logger.debug("Answer stored with ID: %s", answer_id)
 
             quality_metrics = realtime_response.get("quality_metrics", {})
             overall_quality = quality_metrics.get("overall_quality", "adequate")
             should_proceed = realtime_response.get("should_proceed_to_next", True)
 
-            logger.info(f"Answer quality: {overall_quality}, Should proceed: {should_proceed}")
+            logger.debug("Answer quality: %s, Should proceed: %s", overall_quality, should_proceed)
 
             # Step 3: Build AI response structure
-            logger.info("Step 3: Building AI response...")
+            logger.debug("Step 3: Building AI response...")
             ai_response = await self._build_ai_response_with_audio(
                 realtime_response,
-                conversation_stage,
-                generate_audio,
-                voice
+                ctx
             )
 
             # Silent / skipped answers must always advance — never block on a probe.
-            from services.realtime_response_generator import is_silent_answer
             silent_skip = is_silent_answer(user_answer)
             if silent_skip:
                 should_proceed = True
@@ -1139,7 +1435,7 @@ class InterviewOrchestrator:
                 logger.info("Cleared follow_up_probe — will proceed to next question")
 
             # Step 4: Decide on flow and generate next question if needed
-            logger.info("Step 4: Determining flow and next question...")
+            logger.debug("Step 4: Determining flow and next question...")
             next_question = None
             # needs_follow_up is only True when we are NOT proceeding AND a probe is present.
             # These two flags must be mutually exclusive.
@@ -1147,23 +1443,17 @@ class InterviewOrchestrator:
             flow_control = {
                 "should_proceed_to_next": should_proceed,
                 "needs_follow_up": needs_follow_up,
-                "quality_sufficient": overall_quality in ["excellent", "good"],
+                "quality_sufficient": overall_quality in _GOOD_QUALITIES,
                 "conversation_stage": conversation_stage
             }
 
             if should_proceed:
                 # Generate next question with audio
-                next_question_number = question_id + 1
-
                 if next_question_number <= total_questions:
-                    next_question = await self.generate_question_with_audio(
-                        session_id,
-                        next_question_number,
-                        role,
-                        difficulty,
-                        total_questions,
-                        generate_audio,
-                        voice
+                    next_question = await self._await_prefetched_question(
+                        speculative_question,
+                        ctx,
+                        next_question_number
                     )
 
                     # Add transition if proceeding to next question
@@ -1171,7 +1461,7 @@ class InterviewOrchestrator:
                         if silent_skip:
                             transition_text = self.personality.generate_silent_skip_transition()
                         else:
-                            transition_text = self.personality.generate_transition(
+                            transition_text = self._cached_transition(
                                 "your answer",
                                 "the next topic",
                                 "natural"
@@ -1179,11 +1469,13 @@ class InterviewOrchestrator:
                         ai_response["transition"] = await self._generate_audio_for_text(
                             transition_text,
                             "transition",
-                            conversation_stage,
-                            generate_audio,
-                            voice
+                            ctx
                         )
 
+            elif speculative_question is not None:
+                self._park_prefetched_question(session_id, next_question_number, speculative_question)
+                logger.info("Kept speculative next question for after the follow-up probe")
+
             # Build final response
             response = {
                 "answer_stored": answer_stored,
@@ -1194,27 +1486,31 @@ class InterviewOrchestrator:
                 "quality_metrics": quality_metrics
             }
 
-            execution_time = time.time() - start_time
-            logger.info(f"ORCHESTRATOR: Realtime response generated in {execution_time:.2f}s")
-            logger.info("=" * 60)
+            execution_time = time.perf_counter() - start_time
+            logger.info(
+                "Realtime response: session=%s quality=%s proceed=%s elapsed=%.2fs",
+                session_id_str, overall_quality, should_proceed, execution_time
+            )
 
             return response
 
         except Exception as e:
-            logger.error(f"ORCHESTRATOR ERROR in process_answer_with_realtime_response: {str(e)}")
-            logger.exception("Full traceback:")
+            logger.error("ORCHESTRATOR ERROR in process_answer_with_realtime_response: %s", e, exc_info=True)
+
+            if speculative_question is not None:
+                speculative_question.cancel()
 
             # Return graceful fallback
+            acknowledgment = await self._generate_audio_for_text(
+                _TURN_ERROR_ACK_TEXT,
+                "acknowledgment",
+                ctx
+            )
             return {
                 "answer_stored": True,
                 "answer_id": self._generate_answer_id(),
                 "ai_response": {
-                    "acknowledgment": {
-                        "text": "Thank you for that response.",
-                        "audio_url": None,
-                        "should_speak": True,
-                        "tone": "neutral"
-                    },
+                    "acknowledgment": {**acknowledgment, **_ERROR_ACK_FIELDS},
                     "follow_up_probe": None,
                     "transition": None
                 },
@@ -1224,15 +1520,105 @@ class InterviewOrchestrator:
                     difficulty,
                     str(e)
                 ),
-                "flow_control": {
-                    "should_proceed_to_next": True,
-                    "needs_follow_up": False,
-                    "quality_sufficient": True,
-                    "conversation_stage": conversation_stage
-                },
+                "flow_control": {**_ERROR_FLOW_CONTROL, "conversation_stage": conversation_stage},
                 "error": str(e)
             }
 
+    def _park_prefetched_question(
+        self,
+        session_id: UUID,
+        next_question_number: int,
+        task: asyncio.Task
+    ) -> None:
+        """
+        Keep a next-question task for the session, expiring those of abandoned sessions.
+
+        Evicted tasks that are still running are cancelled.
+
+        Args:
+            session_id: The interview session UUID
+            next_question_number: Question number the task generates
+            task: The next-question generation task
+        """
+        now = time.monotonic()
+        prefetch = self._prefetch
+
+        replaced = prefetch.pop(session_id, None)
+        if replaced is not None and replaced[1] is not task:
+            replaced[1].cancel()
+
+        # _prefetch is ordered oldest first, so expired entries lead
+        while prefetch:
+            oldest_session, (_, oldest_task, parked_at) = next(iter(prefetch.items()))
+            if now - parked_at < self.PREFETCH_TTL_SECONDS and len(prefetch) < self.MAX_PREFETCH_ENTRIES:
+                break
+            del prefetch[oldest_session]
+            oldest_task.cancel()
+
+        prefetch[session_id] = (next_question_number, task, now)
+
+    def _take_prefetched_question(
+        self,
+        session_id: UUID,
+        next_question_number: int
+    ) -> Optional[asyncio.Task]:
+        """
+        Claim the session's prefetched next-question task, if it is for this question.
+
+        A prefetch for any other question number is stale and gets cancelled.
+
+        Args:
+            session_id: The interview session UUID
+            next_question_number: Question number about to be asked
+
+        Returns:
+            The prefetch task, or None if there is no usable prefetch
+        """
+        prefetched = self._prefetch.pop(session_id, None)
+        if prefetched is None:
+            return None
+
+        prefetched_number, prefetched_task, _ = prefetched
+        if prefetched_number != next_question_number:
+            prefetched_task.cancel()
+            return None
+
+        logger.debug("Using prefetched question #%d", next_question_number)
+        return prefetched_task
+
+    async def _await_prefetched_question(
+        self,
+        prefetched: Optional[asyncio.Task],
+        ctx: TurnContext,
+        next_question_number: int
+    ) -> Dict[str, Any]:
+        """
+        Await a prefetched next question, generating it directly if there is none or it failed.
+
+        Args:
+            prefetched: Task from _take_prefetched_question, or None
+            ctx: Parameters of the current turn
+            next_question_number: Question number to generate
+
+        Returns:
+            Question data with optional audio URLs
+        """
+        if prefetched is not None:
+            try:
+                return await prefetched
+            except Exception as spec_error:
+                logger.warning("Speculative next question failed, regenerating: %s", spec_error)
+
+        return await self.generate_question_with_audio(
+            ctx.session_id,
+            next_question_number,
+            ctx.role,
+            ctx.difficulty,
+            ctx.total_questions,
+            ctx.generate_audio,
+            ctx.voice
+        )
+
     async def generate_question_with_audio(
         self,
         session_id: UUID,
@@ -1246,6 +1632,70 @@ class InterviewOrchestrator:
         """
         Generate next question with optional TTS audio.
 
+        Concurrent calls with identical arguments share one in-flight
+        generation, and each caller gets its own shallow copy of the result.
+        The shared work is cancelled only once every caller waiting on it has
+        been cancelled.
+
+        Args:
+            session_id: The interview session UUID
+            current_question_number: Current question number
+            role: Job role
+            difficulty: Difficulty level
+            total_questions: Total questions planned
+            generate_audio: Whether to generate TTS audio
+            voice: Interviewer voice override for consistent voice
+
+        Returns:
+            Question data with optional audio URLs
+        """
+        key = (session_id, current_question_number, role, difficulty, total_questions, generate_audio, voice)
+        task = self._inflight_questions.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._generate_question_with_audio(
+                    session_id,
+                    current_question_number,
+                    role,
+                    difficulty,
+                    total_questions,
+                    generate_audio,
+                    voice
+                )
+            )
+            self._inflight_questions[key] = task
+            task.add_done_callback(
+                lambda done, key=key: self._inflight_questions.pop(key, None)
+                if self._inflight_questions.get(key) is done else None
+            )
+        else:
+            logger.info("Joining in-flight generation of question #%s", current_question_number)
+
+        self._inflight_waiters[key] += 1
+        try:
+            return {**await asyncio.shield(task)}
+        except asyncio.CancelledError:
+            if self._inflight_waiters[key] == 1:
+                task.cancel()
+            raise
+        finally:
+            self._inflight_waiters[key] -= 1
+            if self._inflight_waiters[key] <= 0:
+                del self._inflight_waiters[key]
+
+    async def _generate_question_with_audio(
+        self,
+        session_id: UUID,
+        current_question_number: int,
+        role: str,
+        difficulty: str,
+        total_questions: int = 10,
+        generate_audio: bool = True,
+        voice: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate next question with optional TTS audio (uncoalesced).
+
         Args:
             session_id: The interview session UUID
             current_question_number: Current question number
@@ -1279,50 +1729,51 @@ class InterviewOrchestrator:
                 total_questions
             )
 
-            # Generate audio for question text
+            # Generate audio for question text and interviewer comment concurrently
+            tts_jobs = {}
+
             question_text = question_response.get("question", {}).get("text", "")
-            if question_text and await self._should_generate_audio(question_text, "question", True):
-                try:
-                    audio_bytes = await self.tts_service.generate_for_interview_context(
-                        question_text,
-                        context_type="question",
-                        conversation_stage=conversation_stage,
-                        voice_override=voice
-                    )
-                    audio_path = await self.tts_service.save_audio_file(
-                        audio_bytes,
-                        f"question_{current_question_number}"
-                    )
-                    # Extract just the filename for the URL
-                    from pathlib import Path
-                    filename = Path(audio_path).name
+            if question_text and self._should_generate_audio(question_text, "question", True):
+                tts_jobs["question"] = self._tts_and_save(
+                    question_text,
+                    "question",
+                    f"question_{current_question_number}",
+                    conversation_stage,
+                    voice
+                )
+
+            interviewer_comment = question_response.get("interviewer_comment")
+            if interviewer_comment and self._should_generate_audio(interviewer_comment, "acknowledgment", True):
+                tts_jobs["comment"] = self._tts_and_save(
+                    interviewer_comment,
+                    "acknowledgment",
+                    f"comment_{current_question_number}",
+                    conversation_stage,
+                    voice
+                )
+
+            tts_results = dict(zip(
+                tts_jobs,
+                await asyncio.gather(*tts_jobs.values(), return_exceptions=True)
+            ))
+
+            if "question" in tts_results:
+                filename = tts_results["question"]
+                if isinstance(filename, Exception):
+                    logger.warning("Failed to generate question audio: %s", filename)
+                    question_response["question"]["audio_url"] = None
+                else:
                     question_response["question"]["audio_url"] = f"/api/audio/{filename}"
                     logger.info(f"Question audio generated: {filename}")
-                except Exception as e:
-                    logger.warning(f"Failed to generate question audio: {e}")
-                    question_response["question"]["audio_url"] = None
 
-            # Generate audio for interviewer comment if present
-            interviewer_comment = question_response.get("interviewer_comment")
-            if interviewer_comment and await self._should_generate_audio(interviewer_comment, "acknowledgment", True):
-                try:
-                    comment_audio = await self.tts_service.generate_for_interview_context(
-                        interviewer_comment,
-                        context_type="acknowledgment",
-                        conversation_stage=conversation_stage,
-                        voice_override=voice
-                    )
-                    comment_path = await self.tts_service.save_audio_file(
-                        comment_audio,
-                        f"comment_{current_question_number}"
-                    )
-                    from pathlib import Path
-                    filename = Path(comment_path).name
+            if "comment" in tts_results:
+                filename = tts_results["comment"]
+                if isinstance(filename, Exception):
+                    logger.warning("Failed to generate comment audio: %s", filename)
+                    question_response["interviewer_comment_audio_url"] = None
+                else:
                     question_response["interviewer_comment_audio_url"] = f"/api/audio/{filename}"
                     logger.info(f"Comment audio generated: {filename}")
-                except Exception as e:
-                    logger.warning(f"Failed to generate comment audio: {e}")
-                    question_response["interviewer_comment_audio_url"] = None
 
             return question_response
 
@@ -1339,18 +1790,14 @@ class InterviewOrchestrator:
     async def _build_ai_response_with_audio(
         self,
         realtime_response: Dict[str, Any],
-        conversation_stage: str,
-        generate_audio: bool,
-        voice: Optional[str] = None
+        ctx: TurnContext
     ) -> Dict[str, Any]:
         """
         Build AI response structure with optional audio URLs.
 
         Args:
             realtime_response: Response from RealtimeResponseGenerator
-            conversation_stage: Current interview stage
-            generate_audio: Whether to generate audio
-            voice: Interviewer voice override for consistent voice across all clips
+            ctx: Parameters of the current turn (stage, audio flag, voice)
 
         Returns:
             Structured AI response with acknowledgment, probe, and transition
@@ -1361,41 +1808,209 @@ class InterviewOrchestrator:
             "transition": None
         }
 
+        ack_data = realtime_response.get("acknowledgment") or {}
+        probe_data = realtime_response.get("follow_up_probe") or {}
+        ack_text = ack_data.get("text")
+        probe_text = probe_data.get("text")
+
+        # Synthesize acknowledgment and probe audio in one batch
+        ack_result, probe_result = await self._generate_audio_batch(
+            [(ack_text, "acknowledgment"), (probe_text, "follow_up")],
+            ctx
+        )
+
         # Process acknowledgment
-        ack_data = realtime_response.get("acknowledgment", {})
-        if ack_data and ack_data.get("text"):
-            ai_response["acknowledgment"] = await self._generate_audio_for_text(
-                ack_data.get("text"),
-                "acknowledgment",
-                conversation_stage,
-                generate_audio,
-                voice
-            )
+        if ack_text:
+            ai_response["acknowledgment"] = ack_result
             ai_response["acknowledgment"]["should_speak"] = ack_data.get("should_speak", True)
             ai_response["acknowledgment"]["tone"] = ack_data.get("tone", "neutral")
 
         # Process follow-up probe if present
-        probe_data = realtime_response.get("follow_up_probe")
-        if probe_data and probe_data.get("text"):
-            ai_response["follow_up_probe"] = await self._generate_audio_for_text(
-                probe_data.get("text"),
-                "follow_up",
-                conversation_stage,
-                generate_audio,
-                voice
-            )
+        if probe_text:
+            ai_response["follow_up_probe"] = probe_result
             ai_response["follow_up_probe"]["probe_type"] = probe_data.get("probe_type", "specific")
             ai_response["follow_up_probe"]["missing_element"] = probe_data.get("missing_element")
 
         return ai_response
 
-    async def _generate_audio_for_text(
+    async def _tts_and_save(
         self,
         text: str,
         context_type: str,
+        filename: str,
         conversation_stage: str,
-        generate_audio: bool,
         voice: Optional[str] = None
+    ) -> str:
+        """
+        Synthesize text and save it to the audio cache.
+
+        Args:
+            text: Text to convert to speech
+            context_type: Type of content (question, acknowledgment, etc.)
+            filename: Filename prefix for the saved audio
+            conversation_stage: Interview stage
+            voice: Interviewer voice override
+
+        Returns:
+            Saved audio filename (servable under /api/audio/)
+        """
+        audio_bytes = await self.tts_service.generate_for_interview_context(
+            text,
+            context_type=context_type,
+            conversation_stage=conversation_stage,
+            voice_override=voice
+        )
+        audio_path = await self.tts_service.save_audio_file(audio_bytes, filename)
+
+        # Extract just the filename for the URL
+        return Path(audio_path).name
+
+    async def _generate_audio_batch(
+        self,
+        clips: List[Tuple[Optional[str], str]],
+        ctx: TurnContext
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate audio for several pieces of text with a single batched TTS call.
+
+        Batch counterpart of _generate_audio_for_text: a clip whose synthesis or
+        save fails keeps audio_url=None without affecting the others.
+
+        Args:
+            clips: List of (text, context_type) pairs; empty text is skipped
+            ctx: Parameters of the current turn (stage, audio flag, voice)
+
+        Returns:
+            One dict with text and optional audio_url per clip, in input order
+        """
+        results = [{"text": text, "audio_url": None} for text, _ in clips]
+
+        if not ctx.generate_audio:
+            return results
+
+        conversation_stage = ctx.conversation_stage
+        voice = ctx.voice
+        pending = []
+        for index, (text, context_type) in enumerate(clips):
+            if not text or not self._should_generate_audio(text, context_type, True):
+                continue
+            cached_url = self._lookup_phrase_audio(text, context_type, conversation_stage, voice)
+            if cached_url:
+                results[index]["audio_url"] = cached_url
+            else:
+                pending.append((index, text, context_type))
+        if not pending:
+            return results
+
+        audio_blobs = await self.tts_service.generate_interview_batch(
+            [(text, context_type, conversation_stage) for _, text, context_type in pending],
+            voice_override=voice
+        )
+
+        async def save(context_type: str, audio_bytes: Union[bytes, Exception]) -> str:
+            if isinstance(audio_bytes, Exception):
+                raise audio_bytes
+            return await self.tts_service.save_audio_file(audio_bytes, context_type)
+
+        audio_paths = await asyncio.gather(
+            *(save(context_type, blob) for (_, _, context_type), blob in zip(pending, audio_blobs)),
+            return_exceptions=True
+        )
+
+        for (index, text, context_type), audio_path in zip(pending, audio_paths):
+            if isinstance(audio_path, Exception):
+                logger.warning("Failed to generate audio for %s: %s", context_type, audio_path)
+                continue
+            results[index]["audio_url"] = f"/api/audio/{Path(audio_path).name}"
+            self._store_phrase_audio(text, context_type, conversation_stage, voice, results[index]["audio_url"])
+
+        return results
+
+    def _phrase_audio_key(
+        self,
+        text: str,
+        context_type: str,
+        conversation_stage: str,
+        voice: Optional[str]
+    ) -> Optional[Tuple[str, str, str, Optional[str]]]:
+        """
+        Build the phrase-audio cache key, or None if this text isn't worth caching.
+
+        Whitespace is collapsed so trivially different renderings of the same
+        phrase share a clip; wording, case and punctuation are kept because
+        they change what is spoken.
+
+        Args:
+            text: Text to be spoken
+            context_type: Type of content
+            conversation_stage: Interview stage
+            voice: Interviewer voice override
+
+        Returns:
+            Cache key, or None for uncacheable text
+        """
+        if text not in _STATIC_TTS_TEXTS and context_type not in _PHRASE_AUDIO_CONTEXTS:
+            return None
+        return (" ".join(text.split()), context_type, conversation_stage, voice)
+
+    def _lookup_phrase_audio(
+        self,
+        text: str,
+        context_type: str,
+        conversation_stage: str,
+        voice: Optional[str]
+    ) -> Optional[str]:
+        """
+        Return the cached audio URL for a recurring phrase, if still on disk.
+
+        Args:
+            text: Text to be spoken
+            context_type: Type of content
+            conversation_stage: Interview stage
+            voice: Interviewer voice override
+
+        Returns:
+            Audio URL, or None if the phrase has no usable clip
+        """
+        key = self._phrase_audio_key(text, context_type, conversation_stage, voice)
+        if key is None:
+            return None
+
+        audio_url = self._phrase_audio_cache.get(key)
+        if audio_url is None:
+            return None
+
+        # Cache cleanup may have removed the file since it was generated
+        if not (self.tts_service.cache_dir / Path(audio_url).name).exists():
+            del self._phrase_audio_cache[key]
+            return None
+
+        self._phrase_audio_cache.move_to_end(key)
+        return audio_url
+
+    def _store_phrase_audio(
+        self,
+        text: str,
+        context_type: str,
+        conversation_stage: str,
+        voice: Optional[str],
+        audio_url: str
+    ) -> None:
+        """Remember the audio URL generated for a recurring phrase."""
+        key = self._phrase_audio_key(text, context_type, conversation_stage, voice)
+        if key is None:
+            return
+
+        self._phrase_audio_cache[key] = audio_url
+        self._phrase_audio_cache.move_to_end(key)
+        while len(self._phrase_audio_cache) > self.MAX_PHRASE_AUDIO_ENTRIES:
+            self._phrase_audio_cache.popitem(last=False)
+
+    async def _generate_audio_for_text(
+        self,
+        text: str,
+        context_type: str,
+        ctx: TurnContext
     ) -> Dict[str, Any]:
         """
         Generate audio for a piece of text and return structured response.
@@ -1403,9 +2018,7 @@ class InterviewOrchestrator:
         Args:
             text: Text to convert to speech
             context_type: Type of content (question, acknowledgment, etc.)
-            conversation_stage: Interview stage
-            generate_audio: Whether to actually generate audio
-            voice: Interviewer voice override (keeps all clips same voice)
+            ctx: Parameters of the current turn (stage, audio flag, voice)
 
         Returns:
             Dict with text and optional audio_url
@@ -1415,29 +2028,30 @@ class InterviewOrchestrator:
             "audio_url": None
         }
 
-        if not generate_audio or not text:
+        if not ctx.generate_audio or not text:
+            return result
+
+        if not self._should_generate_audio(text, context_type, True):
             return result
 
-        if not await self._should_generate_audio(text, context_type, True):
+        cached_url = self._lookup_phrase_audio(text, context_type, ctx.conversation_stage, ctx.voice)
+        if cached_url:
+            result["audio_url"] = cached_url
             return result
 
         try:
             audio_bytes = await self.tts_service.generate_for_interview_context(
                 text,
                 context_type=context_type,
-                conversation_stage=conversation_stage,
-                voice_override=voice
+                conversation_stage=ctx.conversation_stage,
+                voice_override=ctx.voice
             )
 
-            # Generate unique filename
-            import uuid
-            unique_id = str(uuid.uuid4())[:8]
-            filename = f"{context_type}_{unique_id}"
-
-            audio_path = await self.tts_service.save_audio_file(audio_bytes, filename)
+            # save_audio_file appends the unique id to the filename
+            audio_path = await self.tts_service.save_audio_file(audio_bytes, context_type)
 
-            from pathlib import Path
             result["audio_url"] = f"/api/audio/{Path(audio_path).name}"
+            self._store_phrase_audio(text, context_type, ctx.conversation_stage, ctx.voice, result["audio_url"])
             logger.debug(f"Audio generated for {context_type}: {result['audio_url']}")
 
         except Exception as e:
@@ -1481,14 +2095,10 @@ class InterviewOrchestrator:
                 conversation_stage=conversation_stage
             )
 
-            # Save with meaningful filename
-            import uuid
-            unique_id = str(uuid.uuid4())[:8]
-            filename = f"{context_type}_{unique_id}"
-            file_path = await self.tts_service.save_audio_file(audio_bytes, filename)
+            # Save with meaningful filename (save_audio_file appends the unique id)
+            file_path = await self.tts_service.save_audio_file(audio_bytes, context_type)
 
             # Return relative URL
-            from pathlib import Path
             response_data["audio_url"] = f"/api/audio/{Path(file_path).name}"
 
             logger.info(f"Audio generated for {context_type}: {response_data['audio_url']}")
@@ -1533,20 +2143,23 @@ class InterviewOrchestrator:
         Returns:
             Response similar to process_answer_with_realtime_response
         """
-        session_id_str = str(session_id)
-        follow_up_key = f"{session_id_str}_{original_question_id}"
+        follow_up_key = (session_id, original_question_id)
 
         logger.info(f"Handling follow-up answer for Q{original_question_id}")
 
-        # Track follow-up attempts
-        current_count = self._follow_up_counts.get(follow_up_key, 0)
-        self._follow_up_counts[follow_up_key] = current_count + 1
+        # Earlier attempts for this question; the turn's outcome is recorded
+        # once at the end (cleared on proceed, incremented on another probe)
+        current_count = self._follow_up_counts[follow_up_key]
 
         # Determine conversation stage
         conversation_stage = self._determine_conversation_stage(
             original_question_id,
             total_questions
         )
+        ctx = TurnContext(
+            session_id, role, difficulty, total_questions,
+            generate_audio, conversation_stage, voice
+        )
 
         try:
             # Analyze the follow-up answer quality
@@ -1569,22 +2182,47 @@ class InterviewOrchestrator:
 
             logger.info(f"Follow-up #{current_count + 1}: quality={overall_quality}, proceed={should_proceed}")
 
+            quality_sufficient = overall_quality in _GOOD_QUALITIES
+            max_follow_ups_reached = current_count >= self.MAX_FOLLOW_UPS
+
             # Generate acknowledgment for follow-up
-            if overall_quality in ["excellent", "good"]:
-                ack_quality = "good"
-            else:
-                ack_quality = "adequate"
+            ack_quality = "good" if quality_sufficient else "adequate"
 
             ack_text = self.personality.generate_acknowledgment(ack_quality)
-            acknowledgment = await self._generate_audio_for_text(
-                ack_text,
-                "acknowledgment",
-                conversation_stage,
-                generate_audio,
-                voice
+
+            # This turn speaks the acknowledgment plus either a transition to the
+            # next question or one more probe; synthesize both in one batch
+            next_question_number = original_question_id + 1
+            has_next_question = should_proceed and next_question_number <= total_questions
+            if has_next_question:
+                second_clip = (self._cached_transition("that clarification", "our next topic", "natural"), "transition")
+            elif should_proceed:
+                second_clip = (None, "transition")
+            else:
+                # One more probe if still insufficient and haven't maxed out
+                second_clip = (self._cached_probe("that point", "specific"), "follow_up")
+
+            clips = self._generate_audio_batch(
+                [(ack_text, "acknowledgment"), second_clip],
+                ctx
             )
+
+            # Get next question if proceeding, overlapped with the clip synthesis
+            next_question = None
+            if has_next_question:
+                (acknowledgment, second_result), next_question = await asyncio.gather(
+                    clips,
+                    self._await_prefetched_question(
+                        self._take_prefetched_question(session_id, next_question_number),
+                        ctx,
+                        next_question_number
+                    )
+                )
+            else:
+                acknowledgment, second_result = await clips
+
             acknowledgment["should_speak"] = True
-            acknowledgment["tone"] = "encouraging" if overall_quality in ["excellent", "good"] else "neutral"
+            acknowledgment["tone"] = "encouraging" if quality_sufficient else "neutral"
 
             # Build AI response
             ai_response = {
@@ -1593,54 +2231,16 @@ class InterviewOrchestrator:
                 "transition": None
             }
 
-            # Get next question if proceeding
-            next_question = None
             if should_proceed:
-                next_question_number = original_question_id + 1
-
-                if next_question_number <= total_questions:
-                    # Add transition
-                    transition_text = self.personality.generate_transition(
-                        "that clarification",
-                        "our next topic",
-                        "natural"
-                    )
-                    ai_response["transition"] = await self._generate_audio_for_text(
-                        transition_text,
-                        "transition",
-                        conversation_stage,
-                        generate_audio,
-                        voice
-                    )
-
-                    # Get next question
-                    next_question = await self.generate_question_with_audio(
-                        session_id,
-                        next_question_number,
-                        role,
-                        difficulty,
-                        total_questions,
-                        generate_audio,
-                        voice
-                    )
+                if has_next_question:
+                    ai_response["transition"] = second_result
 
                 # Clean up follow-up tracking
-                if follow_up_key in self._follow_up_counts:
-                    del self._follow_up_counts[follow_up_key]
+                self._follow_up_counts.pop(follow_up_key, None)
 
             else:
-                # One more probe if still insufficient and haven't maxed out
-                probe_text = self.personality.generate_probing_response(
-                    "that point",
-                    "specific"
-                )
-                ai_response["follow_up_probe"] = await self._generate_audio_for_text(
-                    probe_text,
-                    "follow_up",
-                    conversation_stage,
-                    generate_audio,
-                    voice
-                )
+                self._follow_up_counts[follow_up_key] += 1
+                ai_response["follow_up_probe"] = second_result
                 ai_response["follow_up_probe"]["probe_type"] = "specific"
 
             return {
@@ -1654,49 +2254,90 @@ class InterviewOrchestrator:
                 "flow_control": {
                     "should_proceed_to_next": should_proceed,
                     "needs_follow_up": not should_proceed,
-                    "quality_sufficient": overall_quality in ["excellent", "good"],
+                    "quality_sufficient": quality_sufficient,
                     "conversation_stage": conversation_stage,
-                    "max_follow_ups_reached": current_count >= self.MAX_FOLLOW_UPS
+                    "max_follow_ups_reached": max_follow_ups_reached
                 },
                 "quality_metrics": quality_metrics
             }
 
         except Exception as e:
             logger.error(f"Error handling follow-up answer: {e}")
-            # Always proceed on error
+            # Always proceed on error, so this question's tracking is done
+            self._follow_up_counts.pop(follow_up_key, None)
+            acknowledgment, next_question = await asyncio.gather(
+                self._generate_audio_for_text(
+                    _FOLLOW_UP_ERROR_ACK_TEXT,
+                    "acknowledgment",
+                    ctx
+                ),
+                self._await_prefetched_question(
+                    self._take_prefetched_question(session_id, original_question_id + 1),
+                    ctx,
+                    original_question_id + 1
+                )
+            )
             return {
                 "answer_stored": True,
                 "answer_id": self._generate_answer_id(),
                 "is_follow_up_response": True,
                 "original_question_id": original_question_id,
                 "ai_response": {
-                    "acknowledgment": {
-                        "text": "Thank you for that additional detail.",
-                        "audio_url": None,
-                        "should_speak": True,
-                        "tone": "neutral"
-                    },
+                    "acknowledgment": {**acknowledgment, **_ERROR_ACK_FIELDS},
                     "follow_up_probe": None,
                     "transition": None
                 },
-                "next_question": await self.generate_question_with_audio(
-                    session_id,
-                    original_question_id + 1,
-                    role,
-                    difficulty,
-                    total_questions,
-                    generate_audio,
-                    voice
-                ),
-                "flow_control": {
-                    "should_proceed_to_next": True,
-                    "needs_follow_up": False,
-                    "quality_sufficient": True,
-                    "conversation_stage": conversation_stage
-                },
+                "next_question": next_question,
+                "flow_control": {**_ERROR_FLOW_CONTROL, "conversation_stage": conversation_stage},
                 "error": str(e)
             }
 
+    def _cached_transition(
+        self,
+        previous_topic: str,
+        next_topic: str,
+        transition_type: str = "natural"
+    ) -> str:
+        """
+        Get a transition for a fixed argument tuple from cached variants.
+
+        Args:
+            previous_topic: Topic just discussed
+            next_topic: Topic to transition to
+            transition_type: "natural", "shift", "buildup", "contrast"
+
+        Returns:
+            Transition string
+        """
+        key = ("transition", previous_topic, next_topic, transition_type)
+        variants = self._template_cache.get(key)
+        if variants is None:
+            variants = self._template_cache[key] = itertools.cycle([
+                self.personality.generate_transition(previous_topic, next_topic, transition_type)
+                for _ in range(self.TEMPLATE_VARIANTS)
+            ])
+        return next(variants)
+
+    def _cached_probe(self, incomplete_area: str, probe_type: str = "specific") -> str:
+        """
+        Get a probing response for a fixed argument tuple from cached variants.
+
+        Args:
+            incomplete_area: Area needing more detail
+            probe_type: "specific", "process", "result", "role", "challenge"
+
+        Returns:
+            Probing question string
+        """
+        key = ("probe", incomplete_area, probe_type)
+        variants = self._template_cache.get(key)
+        if variants is None:
+            variants = self._template_cache[key] = itertools.cycle([
+                self.personality.generate_probing_response(incomplete_area, probe_type)
+                for _ in range(self.TEMPLATE_VARIANTS)
+            ])
+        return next(variants)
+
     def _determine_conversation_stage(
         self,
         current_question_number: int,
@@ -1712,17 +2353,11 @@ class InterviewOrchestrator:
         Returns:
             Stage string: "early", "mid", or "late"
         """
-        # Calculate progress percentage
-        progress = current_question_number / total_questions
+        if total_questions == 10 and current_question_number >= 0:
+            return _STAGE_LUT_10[min(current_question_number, 10)]
+        return _conversation_stage(current_question_number, total_questions)
 
-        if progress <= 0.3:  # First 30% (Q1-3 for 10 questions)
-            return "early"
-        elif progress >= 0.8:  # Last 20% (Q8+ for 10 questions)
-            return "late"
-        else:
-            return "mid"
-
-    async def _should_generate_audio(
+    def _should_generate_audio(
         self,
         text: str,
         context_type: str,
@@ -1744,16 +2379,76 @@ class InterviewOrchestrator:
             return False
 
         # Empty text
-        if not text or not text.strip():
+        if not text or text.isspace():
             return False
 
-        # Use TTS service's logic
-        return self.tts_service.should_speak_this(text, context_type)
+        # Use TTS service's logic; it is a pure function of (context, text) and
+        # the same phrases come back turn after turn
+        key = (context_type, text)
+        decision = self._should_speak_cache.get(key)
+        if decision is None:
+            decision = self.tts_service.should_speak_this(text, context_type)
+            if len(self._should_speak_cache) >= self.MAX_SHOULD_SPEAK_CACHE_ENTRIES:
+                self._should_speak_cache.pop(next(iter(self._should_speak_cache)))
+            self._should_speak_cache[key] = decision
+        return decision
+
+    async def _generate_embedding(self, text: str) -> List[float]:
+        """
+        Generate an embedding without blocking the event loop.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        async with self._embed_semaphore:
+            return await asyncio.to_thread(generate_embedding, text)
 
     def _generate_answer_id(self) -> str:
-        """Generate a unique answer ID."""
-        import uuid
-        return str(uuid.uuid4())
+        """
+        Generate a unique answer ID.
+
+        IDs are random (version 4) UUIDs like uuid.uuid4(), but drawn from a
+        pool refilled with a single os.urandom call per ANSWER_ID_POOL_SIZE ids.
+
+        Returns:
+            UUID string
+        """
+        if not self._answer_id_pool:
+            raw = os.urandom(16 * self.ANSWER_ID_POOL_SIZE)
+            self._answer_id_pool = [
+                str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+                for i in range(0, len(raw), 16)
+            ]
+        return self._answer_id_pool.pop()
+
+
+# Singleton instance for shared use
+_orchestrator_instance: Optional[InterviewOrchestrator] = None
+
+
+def get_interview_orchestrator() -> InterviewOrchestrator:
+    """
+    Get or create singleton InterviewOrchestrator instance.
+
+    Returns:
+        Shared InterviewOrchestrator instance
+    """
+    global _orchestrator_instance
+
+    if _orchestrator_instance is None:
+        _orchestrator_instance = InterviewOrchestrator()
+
+    return _orchestrator_instance
+
+
+def reset_interview_orchestrator():
+    """Reset the singleton instance (useful for testing)."""
+    global _orchestrator_instance
+    _orchestrator_instance = None
+    logger.info("InterviewOrchestrator singleton reset")
 
 
 # Convenience function for direct usage
@@ -1767,9 +2462,10 @@ async def get_orchestrated_question(
     """
     Convenience function to get an orchestrated question.
 
-    Creates an InterviewOrchestrator instance and gets the next question.
+    Uses the shared InterviewOrchestrator so follow-up counts and caches
+    persist across calls.
     """
-    orchestrator = InterviewOrchestrator()
+    orchestrator = get_interview_orchestrator()
     return await orchestrator.get_next_question(
         session_id,
         current_question_number,
@@ -14,14 +14,146 @@ Key Features:
 
 import random
 import logging
-from typing import Dict, List, Optional, Any
+import functools
+import string
+import sys
+import threading
+from types import MappingProxyType
 from collections import deque
+from typing import Dict, FrozenSet, Mapping, Optional, Any, Tuple, Union
 from datetime import datetime
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Parses response templates for their placeholder names
+_FORMATTER = string.Formatter()
+
+# Shared read-only stand-in for an omitted context/metadata dict
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+# Fixed comment spoken before a follow-up question
+_FOLLOW_UP_PRE_QUESTION_COMMENT = "I'd like to dig a bit deeper on that."
+
+# Question types that add a type-specific pre-question comment
+_PRE_QUESTION_COMMENT_TYPES = frozenset({"follow_up", "deep_dive", "challenge"})
+
+
+class _SafeDict(dict):
+    """
+    Format mapping that renders missing placeholders as empty strings.
+
+    It does not log: renders are memoized, so a warning here would fire only
+    once per (template, context). _select_varied_response warns on every call.
+    """
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_template(template: str, context_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Format a response template, memoized on (template, context).
+
+    The orchestrator calls the generators with a small, fixed set of
+    contexts (e.g. "your answer" -> "the next topic"), so each template
+    only needs to be rendered once per context.
+
+    Args:
+        template: Response template with {placeholders}
+        context_items: Context as a tuple of (key, value) pairs
+
+    Returns:
+        Formatted response string
+    """
+    return template.format_map(_SafeDict(context_items))
+
+
+def _interned(pool):
+    """
+    Intern every response in a pool, so recent-response checks compare by identity.
+
+    Args:
+        pool: Tuple of responses, or dict of such tuples
+
+    Returns:
+        The same pool shape with interned strings
+    """
+    if isinstance(pool, dict):
+        return {key: _interned(responses) for key, responses in pool.items()}
+    return tuple(map(sys.intern, pool))
+
+
+def _time_check_bucket(pool: Tuple[str, ...], phrases: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Responses from a time-check pool that mention any of the given phrases.
+
+    Args:
+        pool: Time-check responses
+        phrases: Lowercase phrases identifying the bucket
+
+    Returns:
+        Matching responses, or the whole pool if none match
+    """
+    bucket = tuple(r for r in pool if any(phrase in r.lower() for phrase in phrases))
+    return bucket or pool
+
+
+def _pool_keys(pool: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """
+    Map the common spellings of a pool's keys (as-is, Capitalized, UPPER) to the key.
+
+    Args:
+        pool: Dict of response pools
+
+    Returns:
+        Spelling -> pool key
+    """
+    return {spelling: key for key in pool for spelling in (key, key.capitalize(), key.upper())}
+
+
+def _resolve_pool_key(pool_keys: Dict[str, str], requested: str, default: str) -> str:
+    """
+    Normalize a requested pool key, lowercasing only for unusual spellings.
+
+    Args:
+        pool_keys: Spelling map from _pool_keys
+        requested: Key as passed by the caller
+        default: Key to use when the request matches no pool
+
+    Returns:
+        Pool key
+    """
+    key = pool_keys.get(requested)
+    if key is None:
+        key = pool_keys.get(requested.lower(), default)
+    return key
+
+
+def _placeholder_templates(
+    *pools: Union[Dict[str, Tuple[str, ...]], Tuple[str, ...]]
+) -> Dict[str, FrozenSet[str]]:
+    """
+    Collect the responses that contain {placeholders} and so need formatting.
+
+    Args:
+        pools: Response pools, either tuples or dicts of tuples
+
+    Returns:
+        Template -> names of the context keys it uses
+    """
+    templates = {}
+    for pool in pools:
+        for responses in (pool.values() if isinstance(pool, dict) else (pool,)):
+            for response in responses:
+                if "{" in response:
+                    templates[response] = frozenset(
+                        field for _, field, _, _ in _FORMATTER.parse(response) if field
+                    )
+    return templates
+
+
 class InterviewerPersonality:
     """
     Generates natural, varied interviewer responses with personality.
@@ -32,17 +164,31 @@ class InterviewerPersonality:
     Attributes:
         interview_stage: Current stage (early/mid/late)
         questions_asked: Number of questions asked so far
-        _recent_*: Deques tracking recently used responses by type
+        _recent_*: Deques (with set mirrors) tracking recently used responses by type
     """
 
+    __slots__ = (
+        "_recent_acknowledgments", "_recent_encouragements", "_recent_transitions",
+        "_recent_probing", "_recent_clarifications", "_recent_active_listening",
+        "_recent_interest", "_recent_acknowledgments_set", "_recent_encouragements_set",
+        "_recent_transitions_set", "_recent_probing_set", "_recent_clarifications_set",
+        "_recent_active_listening_set", "_recent_interest_set", "_all_recents",
+        "interview_stage", "questions_asked",
+        "last_encouragement_question", "active_listening_count", "time_check_given",
+        "_rng", "_selection_cache",
+    )
+
     # Maximum recent responses to track for variety
     RECENT_LIMIT = 5
 
+    # Maximum resolved (pool, context) selections remembered
+    MAX_SELECTION_CACHE_ENTRIES = 64
+
     # ==================== Response Pools ====================
 
     # Acknowledgment responses by quality level
-    ACKNOWLEDGMENTS = {
-        "excellent": [
+    ACKNOWLEDGMENTS = _interned({
+        "excellent": (
             "That's a really strong example.",
             "I appreciate the specific details you provided.",
             "Great answer - you hit all the key points.",
@@ -58,8 +204,8 @@ class InterviewerPersonality:
             "That's a textbook example of how to handle that.",
             "Very thorough. I appreciate that.",
             "You nailed that one.",
-        ],
-        "good": [
+        ),
+        "good": (
             "I see what you're saying.",
             "That makes sense.",
             "Okay, I'm following.",
@@ -75,8 +221,8 @@ class InterviewerPersonality:
             "Makes sense to me.",
             "Good example.",
             "I see the logic there.",
-        ],
-        "adequate": [
+        ),
+        "adequate": (
             "Okay, I understand.",
             "Got it.",
             "I see.",
@@ -92,8 +238,8 @@ class InterviewerPersonality:
             "Sure.",
             "Okay, thanks.",
             "I understand.",
-        ],
-        "weak": [
+        ),
+        "weak": (
             "Alright, noted.",
             "Okay, I see.",
             "Got it, thank you.",
@@ -104,8 +250,8 @@ class InterviewerPersonality:
             "Sure, thank you.",
             "Okay.",
             "I hear you, thanks.",
-        ],
-        "vague": [
+        ),
+        "vague": (
             "Okay, I noted that.",
             "Alright, thanks.",
             "Got it.",
@@ -116,12 +262,12 @@ class InterviewerPersonality:
             "Sure, I see.",
             "Alright.",
             "I understand, thanks.",
-        ],
-    }
+        ),
+    })
 
     # Encouragement responses by performance trend
-    ENCOURAGEMENTS = {
-        "improving": [
+    ENCOURAGEMENTS = _interned({
+        "improving": (
             "You're hitting your stride now.",
             "I like how your answers are getting more detailed.",
             "You're really warming up - great to see.",
@@ -132,8 +278,8 @@ class InterviewerPersonality:
             "Each answer is getting sharper.",
             "I'm seeing real improvement as we go.",
             "You're clearly getting more comfortable.",
-        ],
-        "steady": [
+        ),
+        "steady": (
             "You're doing well, let's continue.",
             "Great consistency in your answers.",
             "You're maintaining good momentum.",
@@ -144,8 +290,8 @@ class InterviewerPersonality:
             "You're staying focused - I like that.",
             "Good steady performance.",
             "You're keeping the bar high.",
-        ],
-        "strong": [
+        ),
+        "strong": (
             "You're doing an excellent job so far.",
             "Really impressive answers across the board.",
             "You're clearly well-prepared.",
@@ -156,37 +302,37 @@ class InterviewerPersonality:
             "Outstanding performance so far.",
             "Your preparation really shows.",
             "You've got a great handle on this.",
-        ],
-        "declining": [
+        ),
+        "declining": (
             "Let's take a breath and refocus.",
             "No worries - take your time with this one.",
             "It's okay to think through this carefully.",
             "Don't rush - quality over speed.",
             "Let's slow down a bit here.",
-        ],
-    }
+        ),
+    })
 
     # Used when the candidate gave no spoken answer (silent skip after rephrase timeout)
-    SILENT_SKIP_ACKNOWLEDGMENTS = [
+    SILENT_SKIP_ACKNOWLEDGMENTS = _interned((
         "No worries — that's completely okay.",
         "That's fine, no problem at all.",
         "Okay, we can move on from that one.",
         "No answer needed there — let's keep going.",
         "That's alright, let's continue.",
         "Okay, no stress — we'll move forward.",
-    ]
+    ))
 
-    SILENT_SKIP_TRANSITIONS = [
+    SILENT_SKIP_TRANSITIONS = _interned((
         "Let's try a different question.",
         "I'll shift to the next topic.",
         "Let's move on to something else.",
         "Let's continue with another question.",
         "Moving on to the next one.",
-    ]
+    ))
 
     # Transition responses by type
-    TRANSITIONS = {
-        "natural": [
+    TRANSITIONS = _interned({
+        "natural": (
             "Thanks for that. Now, let's talk about {next_topic}.",
             "Good. Moving on to {next_topic}...",
             "Appreciate that context. Let's shift to {next_topic}.",
@@ -199,8 +345,8 @@ class InterviewerPersonality:
             "Good answer. Now, about {next_topic}...",
             "I appreciate that. Let's look at {next_topic}.",
             "Okay, moving along to {next_topic}.",
-        ],
-        "shift": [
+        ),
+        "shift": (
             "Let's change gears a bit.",
             "I want to shift focus now.",
             "Let's look at this from a different angle.",
@@ -211,8 +357,8 @@ class InterviewerPersonality:
             "Okay, changing direction here.",
             "Let's shift our focus.",
             "Time for a change of pace.",
-        ],
-        "buildup": [
+        ),
+        "buildup": (
             "Building on what you just said about {previous_topic}...",
             "That connects nicely to what I want to ask next.",
             "Your answer about {previous_topic} leads me to...",
@@ -223,8 +369,8 @@ class InterviewerPersonality:
             "Staying on {previous_topic} for a moment...",
             "Related to what you just mentioned...",
             "That's a good bridge to my next question.",
-        ],
-        "contrast": [
+        ),
+        "contrast": (
             "Now, on a different note...",
             "Let's look at the flip side.",
             "Here's something contrasting...",
@@ -235,11 +381,11 @@ class InterviewerPersonality:
             "Looking at it from another angle...",
             "Here's a different perspective...",
             "Let's consider the alternative...",
-        ],
-    }
+        ),
+    })
 
     # Active listening responses
-    ACTIVE_LISTENING = [
+    ACTIVE_LISTENING = _interned((
         "So what you're saying is {paraphrase}.",
         "If I understand correctly, {paraphrase}.",
         "Let me make sure I've got this - {paraphrase}.",
@@ -252,11 +398,11 @@ class InterviewerPersonality:
         "So your main takeaway was {key_point}.",
         "Let me reflect that back - {paraphrase}.",
         "So the bottom line is {key_point}.",
-    ]
+    ))
 
     # Probing responses by type
-    PROBING = {
-        "specific": [
+    PROBING = _interned({
+        "specific": (
             "Can you give me a specific example?",
             "What exactly did that look like?",
             "Help me visualize that.",
@@ -267,8 +413,8 @@ class InterviewerPersonality:
             "Can you quantify that?",
             "Paint me a picture of that.",
             "What did that actually entail?",
-        ],
-        "process": [
+        ),
+        "process": (
             "Walk me through your process.",
             "How did you approach that?",
             "What were the steps you took?",
@@ -279,8 +425,8 @@ class InterviewerPersonality:
             "How did you structure that?",
             "What was your game plan?",
             "How did you tackle it?",
-        ],
-        "result": [
+        ),
+        "result": (
             "What was the outcome?",
             "How did that turn out?",
             "What were the results?",
@@ -291,8 +437,8 @@ class InterviewerPersonality:
             "How did it conclude?",
             "What were the measurable outcomes?",
             "What difference did it make?",
-        ],
-        "role": [
+        ),
+        "role": (
             "What was YOUR specific role?",
             "Tell me about your individual contribution.",
             "What did YOU personally do?",
@@ -303,8 +449,8 @@ class InterviewerPersonality:
             "Where did you personally add value?",
             "What was your unique contribution?",
             "How did you drive this forward?",
-        ],
-        "challenge": [
+        ),
+        "challenge": (
             "What obstacles did you face?",
             "What made that difficult?",
             "What were the challenges?",
@@ -315,40 +461,40 @@ class InterviewerPersonality:
             "What complications arose?",
             "What setbacks did you face?",
             "What made this tricky?",
-        ],
-    }
+        ),
+    })
 
     # Clarification requests by contradiction type
-    CLARIFICATIONS = {
-        "work_style": [
+    CLARIFICATIONS = _interned({
+        "work_style": (
             "Help me reconcile something about your work style...",
             "I want to understand how you balance {aspect_a} with {aspect_b}.",
             "You mentioned both {aspect_a} and {aspect_b} - how do those fit together?",
             "Can you help me understand your flexibility on work style?",
             "I'm curious how you adapt between {aspect_a} and {aspect_b}.",
-        ],
-        "experience": [
+        ),
+        "experience": (
             "I want to make sure I understand your experience level here...",
             "Help me clarify your background in this area.",
             "Can you connect the dots for me on your experience?",
             "I'm trying to get a clear picture of your expertise here.",
             "Walk me through how you developed this skill.",
-        ],
-        "preference": [
+        ),
+        "preference": (
             "I noticed you mentioned different preferences - can you clarify?",
             "Help me understand what you're really looking for.",
             "Can you prioritize those preferences for me?",
             "I want to understand what matters most to you here.",
             "Let's dig into what you actually prefer.",
-        ],
-        "timeline": [
+        ),
+        "timeline": (
             "Can you clarify the timeline for me?",
             "Help me understand the sequence of events.",
             "Let me make sure I have the timing right.",
             "Can you walk me through when things happened?",
             "I want to get the chronology straight.",
-        ],
-        "general": [
+        ),
+        "general": (
             "Help me reconcile something...",
             "I want to make sure I understand correctly...",
             "Can you clarify that for me?",
@@ -357,11 +503,11 @@ class InterviewerPersonality:
             "Can you help me understand how those fit together?",
             "I want to make sure I'm not missing something...",
             "Can you connect those dots for me?",
-        ],
-    }
+        ),
+    })
 
     # Interest responses for repeated topics
-    INTEREST_RESPONSES = [
+    INTEREST_RESPONSES = _interned((
         "I can tell {topic} is really important to you.",
         "You light up when you talk about {topic}.",
         "Your passion for {topic} comes through clearly.",
@@ -374,10 +520,10 @@ class InterviewerPersonality:
         "I can see {topic} has been a big part of your career.",
         "You have a lot of depth when it comes to {topic}.",
         "It's clear you've invested significantly in {topic}.",
-    ]
+    ))
 
     # Time check responses
-    TIME_CHECKS = [
+    TIME_CHECKS = _interned((
         "We're making good progress - just a few more questions.",
         "We're about halfway through.",
         "I have just a couple more areas to cover.",
@@ -388,7 +534,26 @@ class InterviewerPersonality:
         "Just a handful more questions to cover.",
         "We're coming down the final stretch.",
         "Almost done - just wrapping up a few areas.",
-    ]
+    ))
+
+    # TIME_CHECKS bucketed by questions remaining (<= 2, <= 4, more)
+    _TIME_CHECKS_NEAR_END = _time_check_bucket(TIME_CHECKS, ("home stretch", "almost", "final"))
+    _TIME_CHECKS_FEW_MORE = _time_check_bucket(TIME_CHECKS, ("few more", "handful"))
+    _TIME_CHECKS_MID = _time_check_bucket(TIME_CHECKS, ("halfway", "progress"))
+
+    # Accepted spellings of each dict pool's keys
+    _ACKNOWLEDGMENT_KEYS = _pool_keys(ACKNOWLEDGMENTS)
+    _ENCOURAGEMENT_KEYS = _pool_keys(ENCOURAGEMENTS)
+    _TRANSITION_KEYS = _pool_keys(TRANSITIONS)
+    _PROBING_KEYS = _pool_keys(PROBING)
+    _CLARIFICATION_KEYS = _pool_keys(CLARIFICATIONS)
+
+    # Responses that need str.format, mapped to the context keys they use; all
+    # others are returned as-is
+    _PLACEHOLDER_TEMPLATES = _placeholder_templates(
+        ACKNOWLEDGMENTS, ENCOURAGEMENTS, SILENT_SKIP_ACKNOWLEDGMENTS, SILENT_SKIP_TRANSITIONS,
+        TRANSITIONS, ACTIVE_LISTENING, PROBING, CLARIFICATIONS, INTEREST_RESPONSES, TIME_CHECKS
+    )
 
     # ==================== Initialization ====================
 
@@ -402,6 +567,30 @@ class InterviewerPersonality:
         self._recent_clarifications: deque = deque(maxlen=self.RECENT_LIMIT)
         self._recent_active_listening: deque = deque(maxlen=self.RECENT_LIMIT)
         self._recent_interest: deque = deque(maxlen=self.RECENT_LIMIT)
+        # Set mirrors of the deques above for O(1) "recently used" checks
+        self._recent_acknowledgments_set: set = set()
+        self._recent_encouragements_set: set = set()
+        self._recent_transitions_set: set = set()
+        self._recent_probing_set: set = set()
+        self._recent_clarifications_set: set = set()
+        self._recent_active_listening_set: set = set()
+        self._recent_interest_set: set = set()
+        self._all_recents: Tuple[Union[deque, set], ...] = (
+            self._recent_acknowledgments,
+            self._recent_acknowledgments_set,
+            self._recent_encouragements,
+            self._recent_encouragements_set,
+            self._recent_transitions,
+            self._recent_transitions_set,
+            self._recent_probing,
+            self._recent_probing_set,
+            self._recent_clarifications,
+            self._recent_clarifications_set,
+            self._recent_active_listening,
+            self._recent_active_listening_set,
+            self._recent_interest,
+            self._recent_interest_set,
+        )
 
         # Interview state
         self.interview_stage: str = "early"  # early, mid, late
@@ -410,22 +599,30 @@ class InterviewerPersonality:
         self.active_listening_count: int = 0
         self.time_check_given: bool = False
 
+        # Per-instance generator, so selections don't go through the shared module RNG
+        self._rng: random.Random = random.Random()
+
+        # (response type, raw args) -> (pool key, pool, format context)
+        self._selection_cache: Dict[Tuple, Tuple[str, Tuple[str, ...], Optional[Dict[str, Any]]]] = {}
+
         logger.info("InterviewerPersonality initialized")
 
     # ==================== Core Response Generation ====================
 
     def _select_varied_response(
         self,
-        pool: List[str],
+        pool: Tuple[str, ...],
         recent_deque: deque,
+        recent_set: set,
         context: Dict[str, Any] = None
     ) -> str:
         """
         Select a varied response from a pool, avoiding recent responses.
 
         Args:
-            pool: List of possible responses
+            pool: Tuple of possible responses
             recent_deque: Deque of recently used responses
+            recent_set: Set mirror of recent_deque for fast membership checks
             context: Optional context for template formatting
 
         Returns:
@@ -435,30 +632,53 @@ class InterviewerPersonality:
             return ""
 
         # Filter out recently used responses
-        available = [r for r in pool if r not in recent_deque]
+        available = [r for r in pool if r not in recent_set]
 
-        # If all have been used recently, reset and use full pool
+        # If all have been used recently, reset and use full pool,
+        # at minimum avoiding the very last one used
         if not available:
-            available = pool.copy()
-            # At minimum, avoid the very last one used
-            if recent_deque and recent_deque[-1] in available and len(available) > 1:
-                available.remove(recent_deque[-1])
+            last_used = recent_deque[-1] if recent_deque else None
+            available = [r for r in pool if r != last_used] or pool
 
         # Random selection
-        selected = random.choice(available)
+        selected = available[self._rng.randrange(len(available))]
 
-        # Track usage
+        # Track usage; the deque is bounded, so mirror its eviction in the set
+        evicted = recent_deque[0] if len(recent_deque) == recent_deque.maxlen else None
         recent_deque.append(selected)
-
-        # Format with context if provided
-        if context:
+        recent_set.add(selected)
+        if evicted is not None and evicted not in recent_deque:
+            recent_set.discard(evicted)
+
+        # Format with context if provided and the response has placeholders
+        if context and selected in self._PLACEHOLDER_TEMPLATES:
+            missing = self._PLACEHOLDER_TEMPLATES[selected].difference(context)
+            if missing:
+                logger.warning("Missing context keys for response formatting: %s", sorted(missing))
             try:
-                selected = selected.format(**context)
-            except KeyError as e:
-                logger.warning(f"Missing context key for response formatting: {e}")
+                selected = _render_template(selected, tuple(context.items()))
+            except TypeError:
+                # Unhashable context values can't be memoized
+                selected = selected.format_map(_SafeDict(context))
 
         return selected
 
+    def _cache_selection(
+        self,
+        key: Tuple,
+        selection: Tuple[str, Tuple[str, ...], Optional[Dict[str, Any]]]
+    ) -> None:
+        """
+        Remember a resolved selection, evicting the oldest entry when full.
+
+        Args:
+            key: (response type, raw generator arguments)
+            selection: (pool key, pool, format context)
+        """
+        if len(self._selection_cache) >= self.MAX_SELECTION_CACHE_ENTRIES:
+            self._selection_cache.pop(next(iter(self._selection_cache)))
+        self._selection_cache[key] = selection
+
     def update_interview_stage(self, current_question: int, total_questions: int):
         """
         Update the interview stage based on progress.
@@ -494,20 +714,25 @@ class InterviewerPersonality:
         Returns:
             Natural acknowledgment string
         """
-        quality_key = answer_quality.lower()
-        if quality_key not in self.ACKNOWLEDGMENTS:
-            quality_key = "adequate"
+        # Repeated (quality, topic) pairs reuse the resolved pool and context;
+        # the response itself is still picked fresh for variety
+        cache_key = ("acknowledgment", answer_quality, topic)
+        selection = self._selection_cache.get(cache_key)
+        if selection is None:
+            quality_key = _resolve_pool_key(self._ACKNOWLEDGMENT_KEYS, answer_quality, "adequate")
+            selection = (quality_key, self.ACKNOWLEDGMENTS[quality_key], {"topic": topic} if topic else None)
+            self._cache_selection(cache_key, selection)
 
-        pool = self.ACKNOWLEDGMENTS[quality_key]
-        context = {"topic": topic} if topic else None
+        quality_key, pool, context = selection
 
         response = self._select_varied_response(
             pool,
             self._recent_acknowledgments,
+            self._recent_acknowledgments_set,
             context
         )
 
-        logger.debug(f"Generated acknowledgment ({quality_key}): {response}")
+        logger.debug("Generated acknowledgment (%s): %s", quality_key, response)
         return response
 
     def generate_silent_skip_acknowledgment(self) -> str:
@@ -515,8 +740,9 @@ class InterviewerPersonality:
         response = self._select_varied_response(
             self.SILENT_SKIP_ACKNOWLEDGMENTS,
             self._recent_acknowledgments,
+            self._recent_acknowledgments_set,
         )
-        logger.debug(f"Generated silent-skip acknowledgment: {response}")
+        logger.debug("Generated silent-skip acknowledgment: %s", response)
         return response
 
     def generate_silent_skip_transition(self) -> str:
@@ -524,8 +750,9 @@ class InterviewerPersonality:
         response = self._select_varied_response(
             self.SILENT_SKIP_TRANSITIONS,
             self._recent_transitions,
+            self._recent_transitions_set,
         )
-        logger.debug(f"Generated silent-skip transition: {response}")
+        logger.debug("Generated silent-skip transition: %s", response)
         return response
 
     def generate_encouragement(
@@ -545,28 +772,27 @@ class InterviewerPersonality:
         Returns:
             Encouragement string or None if not appropriate
         """
-        # Don't over-encourage - only every 3-4 questions
-        questions_since_last = question_number - self.last_encouragement_question
-        if questions_since_last < 3:
+        # Don't over-encourage - only every 3-4 questions. Checked before the
+        # random gate: it is cheaper and rejects two calls out of three.
+        if question_number - self.last_encouragement_question < 3:
             return None
 
         # 50% chance to give encouragement even when appropriate
-        if random.random() < 0.5:
+        if self._rng.random() < 0.5:
             return None
 
-        trend_key = performance_trend.lower()
-        if trend_key not in self.ENCOURAGEMENTS:
-            trend_key = "steady"
+        trend_key = _resolve_pool_key(self._ENCOURAGEMENT_KEYS, performance_trend, "steady")
 
         pool = self.ENCOURAGEMENTS[trend_key]
 
         response = self._select_varied_response(
             pool,
-            self._recent_encouragements
+            self._recent_encouragements,
+            self._recent_encouragements_set,
         )
 
         self.last_encouragement_question = question_number
-        logger.debug(f"Generated encouragement ({trend_key}): {response}")
+        logger.debug("Generated encouragement (%s): %s", trend_key, response)
         return response
 
     def generate_transition(
@@ -586,23 +812,27 @@ class InterviewerPersonality:
         Returns:
             Transition string
         """
-        type_key = transition_type.lower()
-        if type_key not in self.TRANSITIONS:
-            type_key = "natural"
-
-        pool = self.TRANSITIONS[type_key]
-        context = {
-            "previous_topic": previous_topic,
-            "next_topic": next_topic
-        }
+        cache_key = ("transition", transition_type, previous_topic, next_topic)
+        selection = self._selection_cache.get(cache_key)
+        if selection is None:
+            type_key = _resolve_pool_key(self._TRANSITION_KEYS, transition_type, "natural")
+            context = {
+                "previous_topic": previous_topic,
+                "next_topic": next_topic
+            }
+            selection = (type_key, self.TRANSITIONS[type_key], context)
+            self._cache_selection(cache_key, selection)
+
+        type_key, pool, context = selection
 
         response = self._select_varied_response(
             pool,
             self._recent_transitions,
+            self._recent_transitions_set,
             context
         )
 
-        logger.debug(f"Generated transition ({type_key}): {response}")
+        logger.debug("Generated transition (%s): %s", type_key, response)
         return response
 
     def generate_active_listening_response(
@@ -627,7 +857,7 @@ class InterviewerPersonality:
             return None
 
         # 30% chance to use when available
-        if random.random() > 0.3:
+        if self._rng.random() > 0.3:
             return None
 
         # Create a simple paraphrase (in production, this could use LLM)
@@ -641,11 +871,12 @@ class InterviewerPersonality:
         response = self._select_varied_response(
             self.ACTIVE_LISTENING,
             self._recent_active_listening,
+            self._recent_active_listening_set,
             context
         )
 
         self.active_listening_count += 1
-        logger.debug(f"Generated active listening: {response}")
+        logger.debug("Generated active listening: %s", response)
         return response
 
     def _create_simple_paraphrase(self, text: str) -> str:
@@ -676,20 +907,23 @@ class InterviewerPersonality:
         Returns:
             Probing question string
         """
-        type_key = probe_type.lower()
-        if type_key not in self.PROBING:
-            type_key = "specific"
+        cache_key = ("probing", probe_type, incomplete_area)
+        selection = self._selection_cache.get(cache_key)
+        if selection is None:
+            type_key = _resolve_pool_key(self._PROBING_KEYS, probe_type, "specific")
+            selection = (type_key, self.PROBING[type_key], {"area": incomplete_area})
+            self._cache_selection(cache_key, selection)
 
-        pool = self.PROBING[type_key]
-        context = {"area": incomplete_area}
+        type_key, pool, context = selection
 
         response = self._select_varied_response(
             pool,
             self._recent_probing,
+            self._recent_probing_set,
             context
         )
 
-        logger.debug(f"Generated probe ({type_key}): {response}")
+        logger.debug("Generated probe (%s): %s", type_key, response)
         return response
 
     def generate_clarification_request(
@@ -709,9 +943,7 @@ class InterviewerPersonality:
         Returns:
             Clarification request string
         """
-        type_key = contradiction_type.lower()
-        if type_key not in self.CLARIFICATIONS:
-            type_key = "general"
+        type_key = _resolve_pool_key(self._CLARIFICATION_KEYS, contradiction_type, "general")
 
         pool = self.CLARIFICATIONS[type_key]
 
@@ -724,10 +956,11 @@ class InterviewerPersonality:
         response = self._select_varied_response(
             pool,
             self._recent_clarifications,
+            self._recent_clarifications_set,
             format_context
         )
 
-        logger.debug(f"Generated clarification ({type_key}): {response}")
+        logger.debug("Generated clarification (%s): %s", type_key, response)
         return response
 
     def generate_interest_response(
@@ -755,10 +988,11 @@ class InterviewerPersonality:
         response = self._select_varied_response(
             self.INTEREST_RESPONSES,
             self._recent_interest,
+            self._recent_interest_set,
             context
         )
 
-        logger.debug(f"Generated interest response for '{repeated_topic}': {response}")
+        logger.debug("Generated interest response for '%s': %s", repeated_topic, response)
         return response
 
     def generate_time_check(
@@ -778,37 +1012,67 @@ class InterviewerPersonality:
         Returns:
             Time check string or None
         """
-        # Only give one time check per interview
-        if self.time_check_given:
-            return None
-
-        # Only give in mid-stage
-        if self.interview_stage != "mid":
+        # Only give one time check per interview, and only in mid-stage
+        if self.time_check_given or self.interview_stage != "mid":
             return None
 
         # 40% chance when conditions are right
-        if random.random() > 0.4:
+        if self._rng.random() > 0.4:
             return None
 
         # Select appropriate response based on remaining questions
         if questions_remaining <= 2:
-            filtered_pool = [r for r in self.TIME_CHECKS if "home stretch" in r or "almost" in r.lower() or "final" in r]
+            filtered_pool = self._TIME_CHECKS_NEAR_END
         elif questions_remaining <= 4:
-            filtered_pool = [r for r in self.TIME_CHECKS if "few more" in r or "handful" in r]
+            filtered_pool = self._TIME_CHECKS_FEW_MORE
         else:
-            filtered_pool = [r for r in self.TIME_CHECKS if "halfway" in r or "progress" in r]
-
-        if not filtered_pool:
-            filtered_pool = self.TIME_CHECKS
+            filtered_pool = self._TIME_CHECKS_MID
 
-        response = random.choice(filtered_pool)
+        response = filtered_pool[self._rng.randrange(len(filtered_pool))]
         self.time_check_given = True
 
-        logger.debug(f"Generated time check: {response}")
+        logger.debug("Generated time check: %s", response)
         return response
 
     # ==================== Main Variety Method ====================
 
+    # Response type -> handler taking (personality, get_varied_response context)
+    _DISPATCH = {
+        "acknowledgment": lambda self, context: self.generate_acknowledgment(
+            answer_quality=context.get("quality", "good"),
+            topic=context.get("topic")
+        ),
+        "encouragement": lambda self, context: self.generate_encouragement(
+            question_number=context.get("question_number", self.questions_asked),
+            performance_trend=context.get("trend", "steady")
+        ),
+        "transition": lambda self, context: self.generate_transition(
+            previous_topic=context.get("previous_topic", "that"),
+            next_topic=context.get("next_topic", "something else"),
+            transition_type=context.get("transition_type", "natural")
+        ),
+        "active_listening": lambda self, context: self.generate_active_listening_response(
+            answer_excerpt=context.get("excerpt", ""),
+            key_point=context.get("key_point")
+        ),
+        "probing": lambda self, context: self.generate_probing_response(
+            incomplete_area=context.get("area", "that point"),
+            probe_type=context.get("probe_type", "specific")
+        ),
+        "clarification": lambda self, context: self.generate_clarification_request(
+            contradiction_type=context.get("contradiction_type", "general"),
+            context=context
+        ),
+        "interest": lambda self, context: self.generate_interest_response(
+            repeated_topic=context.get("topic", "this topic"),
+            mention_count=context.get("mention_count", 3)
+        ),
+        "time_check": lambda self, context: self.generate_time_check(
+            questions_remaining=context.get("remaining", 5),
+            total_time_elapsed=context.get("elapsed")
+        ),
+    }
+
     def get_varied_response(
         self,
         response_type: str,
@@ -826,61 +1090,13 @@ class InterviewerPersonality:
         Returns:
             Appropriate response string or None
         """
-        context = context or {}
-
-        if response_type == "acknowledgment":
-            return self.generate_acknowledgment(
-                answer_quality=context.get("quality", "good"),
-                topic=context.get("topic")
-            )
-
-        elif response_type == "encouragement":
-            return self.generate_encouragement(
-                question_number=context.get("question_number", self.questions_asked),
-                performance_trend=context.get("trend", "steady")
-            )
-
-        elif response_type == "transition":
-            return self.generate_transition(
-                previous_topic=context.get("previous_topic", "that"),
-                next_topic=context.get("next_topic", "something else"),
-                transition_type=context.get("transition_type", "natural")
-            )
-
-        elif response_type == "active_listening":
-            return self.generate_active_listening_response(
-                answer_excerpt=context.get("excerpt", ""),
-                key_point=context.get("key_point")
-            )
-
-        elif response_type == "probing":
-            return self.generate_probing_response(
-                incomplete_area=context.get("area", "that point"),
-                probe_type=context.get("probe_type", "specific")
-            )
-
-        elif response_type == "clarification":
-            return self.generate_clarification_request(
-                contradiction_type=context.get("contradiction_type", "general"),
-                context=context
-            )
-
-        elif response_type == "interest":
-            return self.generate_interest_response(
-                repeated_topic=context.get("topic", "this topic"),
-                mention_count=context.get("mention_count", 3)
-            )
-
-        elif response_type == "time_check":
-            return self.generate_time_check(
-                questions_remaining=context.get("remaining", 5),
-                total_time_elapsed=context.get("elapsed")
-            )
-
-        else:
-            logger.warning(f"Unknown response type: {response_type}")
+        handler = self._DISPATCH.get(response_type)
+        if handler is None:
+            logger.warning("Unknown response type: %s", response_type)
             return None
 
+        return handler(self, context if context is not None else _EMPTY_CONTEXT)
+
     # ==================== Compound Responses ====================
 
     def generate_pre_question_comment(
@@ -900,59 +1116,64 @@ class InterviewerPersonality:
         Returns:
             Combined pre-question comment or None
         """
-        metadata = metadata or {}
-        comments = []
+        metadata = metadata if metadata is not None else _EMPTY_CONTEXT
+        get = metadata.get
+
+        # Nothing to say when no acknowledgment is asked for, the question
+        # type has no comment of its own, and both the encouragement and
+        # time-check gates are closed. Neither gate draws from the RNG, so
+        # skipping them leaves the random sequence unchanged.
+        if (
+            not get("previous_answer_quality")
+            and question_type not in _PRE_QUESTION_COMMENT_TYPES
+            and self.questions_asked - self.last_encouragement_question < 3
+            and (self.time_check_given or self.interview_stage != "mid")
+        ):
+            return None
 
         # Maybe add acknowledgment of previous answer
-        if metadata.get("previous_answer_quality"):
-            ack = self.generate_acknowledgment(metadata["previous_answer_quality"])
-            if ack:
-                comments.append(ack)
+        previous_quality = get("previous_answer_quality")
+        ack = self.generate_acknowledgment(previous_quality) if previous_quality else None
 
         # Maybe add encouragement
         encouragement = self.generate_encouragement(
             self.questions_asked,
-            metadata.get("performance_trend", "steady")
+            get("performance_trend", "steady")
         )
-        if encouragement:
-            comments.append(encouragement)
 
         # Add type-specific comment
+        type_comment = None
         if question_type == "follow_up":
-            comments.append("I'd like to dig a bit deeper on that.")
+            type_comment = _FOLLOW_UP_PRE_QUESTION_COMMENT
         elif question_type == "deep_dive":
-            topic = metadata.get("topic", "this area")
-            interest = self.generate_interest_response(topic, metadata.get("mention_count", 3))
-            if interest:
-                comments.append(interest)
+            topic = get("topic", "this area")
+            type_comment = self.generate_interest_response(topic, get("mention_count", 3))
         elif question_type == "challenge":
-            clarification = self.generate_clarification_request(
-                metadata.get("contradiction_type", "general"),
+            type_comment = self.generate_clarification_request(
+                get("contradiction_type", "general"),
                 metadata
             )
-            if clarification:
-                comments.append(clarification)
 
         # Maybe add time check
         time_check = self.generate_time_check(
-            metadata.get("questions_remaining", 5)
+            get("questions_remaining", 5)
         )
-        if time_check:
-            comments.append(time_check)
 
-        if comments:
-            return " ".join(comments)
-        return None
+        # Most turns produce zero or one comment, which need no join, and
+        # a pair is cheaper to format directly than to join
+        parts = [part for part in (ack, encouragement, type_comment, time_check) if part]
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        if len(parts) == 2:
+            return f"{parts[0]} {parts[1]}"
+        return " ".join(parts)
 
     def reset(self):
         """Reset all internal state for a new interview."""
-        self._recent_acknowledgments.clear()
-        self._recent_encouragements.clear()
-        self._recent_transitions.clear()
-        self._recent_probing.clear()
-        self._recent_clarifications.clear()
-        self._recent_active_listening.clear()
-        self._recent_interest.clear()
+        for recent in self._all_recents:
+            recent.clear()
 
         self.interview_stage = "early"
         self.questions_asked = 0
@@ -966,6 +1187,7 @@ class InterviewerPersonality:
 # ==================== Singleton & Convenience Functions ====================
 
 _personality_instance: Optional[InterviewerPersonality] = None
+_personality_lock = threading.Lock()
 
 
 def get_interviewer_personality() -> InterviewerPersonality:
@@ -976,18 +1198,19 @@ def get_interviewer_personality() -> InterviewerPersonality:
         The shared InterviewerPersonality instance
     """
     global _personality_instance
-    if _personality_instance is None:
-        _personality_instance = InterviewerPersonality()
-    return _personality_instance
+    instance = _personality_instance
+    if instance is None:
+        # Threaded workers can race here; only one may create the instance
+        with _personality_lock:
+            if _personality_instance is None:
+                _personality_instance = InterviewerPersonality()
+            instance = _personality_instance
+    return instance
 
 
 def reset_interviewer_personality() -> None:
     """Reset the singleton instance for a new interview."""
-    global _personality_instance
-    if _personality_instance:
-        _personality_instance.reset()
-    else:
-        _personality_instance = InterviewerPersonality()
+    get_interviewer_personality().reset()
 
  
 # ==================== Quick Access Functions ====================
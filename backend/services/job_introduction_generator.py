@@ -13,23 +13,28 @@ Each segment is generated with natural language and converted to speech.
 """
 
 import os
+import re
 import json
 import hashlib
+import time
+import random
 import asyncio
-from typing import List, Dict, Optional, Tuple
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 from enum import Enum
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
 
-# Import related services
+# Related services are imported lazily in _ensure_services; the backend
+# directory only needs to be importable when this file runs as a script
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
 
-try:
-    from services.tts_service import TTSService, get_tts_service
-    from services.interviewer_personality import InterviewerPersonality, get_interviewer_personality
-except ImportError:
-    TTSService = None
-    InterviewerPersonality = None
+if TYPE_CHECKING:
+    from services.tts_service import TTSService
+    from services.interviewer_personality import InterviewerPersonality
 
 
 class IntroductionMode(Enum):
@@ -75,6 +80,301 @@ SEGMENT_DURATIONS = {
     },
 }
 
+# Requirement-scoring patterns for _extract_top_skills. Each is a plain
+# substring alternation, so one search replaces a loop of `in` checks.
+_EXPERIENCE_RE = re.compile(r"year|yr")
+_TECH_KEYWORD_RE = re.compile("|".join(map(re.escape, [
+    "python", "java", "javascript", "react", "node", "sql", "aws",
+    "kubernetes", "docker", "api", "microservices", "system design",
+    "machine learning", "data", "cloud", "agile", "ci/cd"
+])))
+_MUST_HAVE_RE = re.compile(r"must|required|essential")
+_DEGREE_RE = re.compile(r"degree|bachelor|master")
+
+# Word characters for resume/requirement matching; keeps "c++", "c#", "node.js"
+_SKILL_WORD_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def _skill_words(text: str) -> set:
+    """Lowercased words longer than three characters, without surrounding periods."""
+    words = (word.strip(".") for word in _SKILL_WORD_RE.findall(text.lower()))
+    return {word for word in words if len(word) > 3}
+
+
+def _matching_skills(requirements: List[str], candidate_resume_summary: Optional[str]) -> List[str]:
+    """Top-five requirements that share a word with the resume summary."""
+    if not candidate_resume_summary or not requirements:
+        return []
+
+    # Simple keyword matching on whole words
+    resume_words = _skill_words(candidate_resume_summary)
+    return [req for req in requirements[:5] if not resume_words.isdisjoint(_skill_words(req))]
+
+
+@functools.lru_cache(maxsize=512)
+def _top_skills(requirements: Tuple[str, ...], count: int) -> Tuple[str, ...]:
+    """Score requirements and return the top `count` (memoized; the same JD recurs per candidate)."""
+    # Score each requirement
+    scored = []
+    for req in requirements:
+        score = 0
+        req_lower = req.lower()
+
+        # Prioritize years of experience
+        if _EXPERIENCE_RE.search(req_lower):
+            score += 10
+
+        # Prioritize specific technologies/skills
+        if _TECH_KEYWORD_RE.search(req_lower):
+            score += 5
+
+        # Prioritize "must have" or "required" keywords
+        if _MUST_HAVE_RE.search(req_lower):
+            score += 8
+
+        # Prioritize degree requirements
+        if _DEGREE_RE.search(req_lower):
+            score += 6
+
+        # Shorter requirements are often more specific/important
+        if len(req) < 50:
+            score += 2
+
+        scored.append((score, req))
+
+    # Sort by score descending and return top N
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return tuple(req for score, req in scored[:count])
+
+
+# Generated segment text is cached on disk for a week; the same job is
+# usually introduced to several candidates
+TEXT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# System message shared by every introduction prompt
+_SYSTEM_PROMPT = """You are a professional, warm interviewer introducing job roles.
+Your tone is:
+- Professional but friendly
+- Welcoming and encouraging
+- Clear and concise
+- Not overwhelming or intimidating
+
+Keep responses brief and natural-sounding when spoken aloud."""
+
+# Greeting and transition variations, formatted with name/title/company
+_GREETINGS_WITH_NAME = (
+    "Hi {name}! Thanks for your interest in the {title} position at {company}.",
+    "Hello {name}! Great to have you here for the {title} interview at {company}.",
+    "Welcome, {name}! We're excited you're interested in the {title} role at {company}.",
+    "Hi {name}, thanks for taking the time to interview for the {title} position at {company}.",
+)
+
+_GREETINGS_WITHOUT_NAME = (
+    "Hi! Thanks for applying to {company} for the {title} role.",
+    "Hello and welcome! Thanks for your interest in the {title} position at {company}.",
+    "Welcome! We're excited you're interested in the {title} role at {company}.",
+    "Hi there! Thanks for taking the time to interview for the {title} position at {company}.",
+    "Great to have you here for the {title} interview at {company}.",
+)
+
+_TRANSITIONS = (
+    "Now that you understand what we're looking for, let's talk about your background.",
+    "With that context in mind, I'd love to hear about your experience.",
+    "Let's dive into your qualifications for this {title} role.",
+    "With that overview, let's get to know you better.",
+    "Now, let's talk about you and your experience.",
+    "That's what we're looking for. Now, tell me about yourself.",
+    "With that context, let's discuss how your background fits.",
+)
+
+# Fixed prompt instructions. Prompts put these first and the job-specific
+# details last, so repeated calls share a byte-identical prefix that OpenAI
+# prompt caching can reuse. The full prompts below are format templates
+# built once at import.
+_ROLE_OVERVIEW_INSTRUCTIONS = """Generate a brief role overview for an interview (2-3 sentences max).
+
+Write a natural, conversational overview that:
+- Mentions the team if available
+- Explains the high-level purpose of the role
+- Hints at impact/scope
+- Is warm and professional
+
+Example format: "This role is with our Backend Infrastructure Team. You'd be working on systems that power our core services, serving millions of users daily."
+
+Keep it concise and avoid buzzwords. Just the overview, no greeting or transition."""
+
+_RESPONSIBILITIES_INSTRUCTIONS = """Summarize the job responsibilities below in natural, conversational sentences.
+
+Rules:
+- Combine into 2-3 flowing sentences (NOT bullet points)
+- Start with "Your main responsibilities would include..." or similar
+- Keep it under 30 seconds when spoken (roughly 75-80 words)
+- Be specific but concise
+- Make it sound engaging, not boring
+
+Just write the summary, nothing else."""
+
+_REQUIREMENTS_INSTRUCTIONS = """Summarize the job requirements below in a natural, encouraging way.
+
+Rules:
+- Write 2-3 natural sentences (NOT bullet points)
+- Start with "We're looking for someone with..." or similar
+- Distinguish between required and nice-to-have if applicable
+- Be encouraging, not intimidating
+- Keep it under 25 seconds when spoken (roughly 60-65 words)
+
+Just write the summary, nothing else."""
+
+_FUSED_SEGMENTS_INSTRUCTIONS = """Write the spoken segments of an interview introduction for the job described below.
+
+Return a JSON object with these keys:
+- "role_overview": a brief role overview (2-3 sentences max) that mentions the team if available, explains the high-level purpose of the role and hints at impact/scope. Warm and professional, no buzzwords.
+- "responsibilities": the responsibilities in 2-3 flowing sentences starting with "Your main responsibilities would include..." or similar, under 80 words, specific and engaging. Omit this key when no responsibilities are listed.
+- "requirements": the requirements in 2-3 encouraging sentences starting with "We're looking for someone with..." or similar, distinguishing required from nice-to-have, under 65 words. Omit this key when no qualifications are listed.
+
+Each value is natural spoken text (no bullet points, no greeting or transition)."""
+
+_FUSED_FIRST_QUESTION_INSTRUCTIONS = """Also include a "first_question" key: a personalized first interview question that starts like "Tell me about yourself...", is warm and engaging, and ties the candidate's experience to the role when it is listed below, or otherwise asks what attracted them to this specific role."""
+
+_FIRST_QUESTION_WITH_SKILL_INSTRUCTIONS = """Generate a personalized first interview question for the job below.
+
+Create a first question that:
+- Starts like "Tell me about yourself..."
+- Ties their experience to the role
+- Is warm and engaging
+
+Example: "I see you have experience with distributed systems. Tell me about yourself and how that experience relates to what we're building here."
+
+Write only the question, nothing else."""
+
+_FIRST_QUESTION_INSTRUCTIONS = """Generate a personalized first interview question for the job below.
+
+Create a first question that:
+- Starts like "Tell me about yourself..."
+- Asks what attracted them to this specific role
+- Is warm and engaging
+
+Example: "Tell me about yourself and specifically what attracted you to the Senior Software Engineer position at Google."
+
+Write only the question, nothing else."""
+
+# Job-detail sections appended after the instructions
+_JOB_DETAILS_SECTION = "Job Title: {job_title}\nCompany: {company_name}\n{context}"
+_RESPONSIBILITIES_SECTION = "Responsibilities:\n{responsibilities}"
+_REQUIREMENTS_SECTION = "Required qualifications:\n{requirements}{nice_to_have}"
+_NICE_TO_HAVE_SECTION = "\n\nNice to have:\n{nice_to_have}"
+_CANDIDATE_SKILL_SECTION = "Candidate has experience with: {skill_mention}"
+
+_ROLE_OVERVIEW_PROMPT = _ROLE_OVERVIEW_INSTRUCTIONS + "\n\n" + _JOB_DETAILS_SECTION
+_RESPONSIBILITIES_PROMPT = _RESPONSIBILITIES_INSTRUCTIONS + "\n\n" + _RESPONSIBILITIES_SECTION
+_REQUIREMENTS_PROMPT = _REQUIREMENTS_INSTRUCTIONS + "\n\n" + _REQUIREMENTS_SECTION
+_FIRST_QUESTION_WITH_SKILL_PROMPT = (
+    _FIRST_QUESTION_WITH_SKILL_INSTRUCTIONS
+    + "\n\nJob: {job_title} at {company_name}\n" + _CANDIDATE_SKILL_SECTION
+)
+_FIRST_QUESTION_PROMPT = _FIRST_QUESTION_INSTRUCTIONS + "\n\nJob: {job_title} at {company_name}"
+
+
+def _bullets(items) -> str:
+    """Render items as '- item' lines for a prompt."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _nice_to_have_section(items) -> str:
+    """Render the optional nice-to-have block of the requirements section."""
+    return _NICE_TO_HAVE_SECTION.format(nice_to_have=_bullets(items)) if items else ""
+
+
+# ==================== Template segment text ====================
+# Used when LLM generation fails, and instead of the LLM for sparse job
+# descriptions where it adds little beyond polish.
+
+def _role_overview_template(company_name: str, job_title: str, team_name: Optional[str]) -> str:
+    if team_name:
+        return f"This role is with the {team_name} at {company_name}. You'd be working on key projects that drive our core business objectives."
+    return f"As a {job_title} at {company_name}, you'll be contributing to impactful projects that matter to our organization."
+
+
+def _responsibilities_template(top_responsibilities: List[str]) -> str:
+    resp_list = ", ".join(top_responsibilities[:-1]) if len(top_responsibilities) > 1 else top_responsibilities[0]
+    if len(top_responsibilities) > 1:
+        resp_list += f", and {top_responsibilities[-1]}"
+    return f"Your main responsibilities would include {resp_list}."
+
+
+def _requirements_template(top_requirements: List[str], top_nice_to_have: List[str]) -> str:
+    req_text = ", ".join(top_requirements)
+    result = f"We're looking for someone with {req_text}."
+    if top_nice_to_have:
+        nice_text = " or ".join(top_nice_to_have)
+        result += f" If you've also worked with {nice_text}, that's a plus."
+    return result
+
+
+def _audio_cache_key(segment: Dict) -> Optional[str]:
+    """TTS cache key derived from a segment's text, None when it has no text."""
+    text = segment.get("text")
+    if not text:
+        return None
+    return f"intro_{segment.get('segment_type', 'intro')}_{hashlib.blake2b(text.encode(), digest_size=4).hexdigest()}"
+
+
+class _AudioBatch:
+    """
+    TTS jobs for one introduction.
+
+    Each segment is handed over as soon as its text exists, so the greeting
+    and transition are synthesized while the LLM is still writing the rest.
+    Cache keys are derived when a segment is started; the request itself is
+    dispatched once the caller next yields to the event loop.
+    """
+
+    def __init__(self, generator: "JobIntroductionGenerator", max_concurrent: int):
+        self._generator = generator
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self, segments: List[Dict]) -> None:
+        """Start synthesizing the given segments; audio fields are filled in place."""
+        jobs = [(segment, _audio_cache_key(segment)) for segment in segments]
+        self._tasks.extend(
+            asyncio.create_task(self._generator._generate_segment_audio(segment, cache_key, self._semaphore))
+            for segment, cache_key in jobs
+        )
+
+    async def wait(self) -> None:
+        """Wait for every started segment to finish."""
+        await asyncio.gather(*self._tasks)
+
+
+# Shared by every generator so concurrent introductions reuse one
+# connection pool and keep-alive sockets
+_openai_client: Optional[AsyncOpenAI] = None
+
+# Max chat completions in flight across all introductions, and how often a
+# 429 is retried with backoff before giving up
+MAX_CONCURRENT_LLM_CALLS = 8
+LLM_RATE_LIMIT_RETRIES = 4
+_llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+
+def _get_openai_client() -> AsyncOpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    return _openai_client
+
+
+def _stable_index(key: str, size: int) -> int:
+    """
+    Map a string to an index in [0, size) that is the same in every process.
+
+    The builtin hash() is salted per process, so it would pick a different
+    greeting or transition for the same job after each restart.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % size
+
 
 class JobIntroductionGenerator:
     """
@@ -86,11 +386,17 @@ class JobIntroductionGenerator:
     - Personality-driven variety via InterviewerPersonality
     """
 
+    # Max TTS requests in flight per introduction
+    MAX_CONCURRENT_TTS = 5
+
     def __init__(
         self,
         interviewer_personality: Optional['InterviewerPersonality'] = None,
         tts_service: Optional['TTSService'] = None,
-        mode: IntroductionMode = IntroductionMode.CONCISE
+        mode: IntroductionMode = IntroductionMode.CONCISE,
+        text_cache_dir: Optional[str] = None,
+        max_text_cache_files: int = 500,
+        skip_llm_when_simple: bool = True
     ):
         """
         Initialize the job introduction generator.
@@ -99,16 +405,32 @@ class JobIntroductionGenerator:
             interviewer_personality: Service for personality-driven text variations
             tts_service: Service for text-to-speech conversion
             mode: Introduction length mode (CONCISE or DETAILED)
+            text_cache_dir: Directory for caching generated segment text
+                (defaults to intro_text_cache/ in the backend directory)
+            max_text_cache_files: Maximum number of cached segment texts to keep
+            skip_llm_when_simple: Use template text instead of the LLM for sparse
+                job descriptions (no company/role description, at most three
+                responsibilities)
         """
         self.personality = interviewer_personality
         self.tts_service = tts_service
         self.mode = mode
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.skip_llm_when_simple = skip_llm_when_simple
+        self._durations = SEGMENT_DURATIONS.get(mode, SEGMENT_DURATIONS[IntroductionMode.CONCISE])
+        self.client = _get_openai_client()
 
         # Audio settings for introductions
         self.audio_voice = "alloy"  # Professional voice
         self.audio_speed = 0.9      # Slightly slower for clarity
 
+        # Prompt tokens served from OpenAI's prompt cache so far
+        self.cached_prompt_tokens = 0
+
+        # Setup segment text cache directory
+        self.text_cache_dir = Path(text_cache_dir or os.path.join(_BACKEND_DIR, "intro_text_cache"))
+        self.text_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_text_cache_files = max_text_cache_files
+
         # Lazy load services if not provided
         self._services_initialized = False
 
@@ -119,12 +441,14 @@ class JobIntroductionGenerator:
 
         if self.personality is None:
             try:
+                from services.interviewer_personality import get_interviewer_personality
                 self.personality = get_interviewer_personality()
             except Exception as e:
                 print(f"Could not initialize InterviewerPersonality: {e}")
 
         if self.tts_service is None:
             try:
+                from services.tts_service import get_tts_service
                 self.tts_service = get_tts_service()
             except Exception as e:
                 print(f"Could not initialize TTSService: {e}")
@@ -165,6 +489,36 @@ class JobIntroductionGenerator:
         """
         self._ensure_services()
 
+        # Audio for each segment starts as soon as its text is ready
+        audio = self._new_audio_batch() if generate_audio else None
+        segments, _ = await self._build_opening_segments(job_description, candidate_name, audio=audio)
+        if audio:
+            await audio.wait()
+
+        return segments
+
+    async def _build_opening_segments(
+        self,
+        job_description: Dict,
+        candidate_name: str = None,
+        fuse_first_question: bool = False,
+        candidate_resume_summary: str = None,
+        audio: Optional[_AudioBatch] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Generate the opening sequence segment texts.
+
+        Args:
+            job_description: Job description dict
+            candidate_name: Optional candidate name for personalization
+            fuse_first_question: Ask the fused LLM call for the first question too
+            candidate_resume_summary: Optional resume summary for the first question
+            audio: Optional TTS batch; each segment is started on it as soon as
+                its text exists (the caller waits for it)
+
+        Returns:
+            (segments, first question text from the fused call or None)
+        """
         # Extract key fields with fallbacks
         company_name = job_description.get("company_name", "the company")
         job_title = job_description.get("job_title", "this position")
@@ -176,71 +530,211 @@ class JobIntroductionGenerator:
         role_description = job_description.get("role_description")
         location = job_description.get("location")
 
-        segments = []
+        def build_segment(segment_type: SegmentType, order: int, text: str) -> Dict:
+            return {
+                "segment_type": segment_type.value,
+                "text": text,
+                "order": order,
+                "duration_estimate_seconds": self._get_duration_estimate(segment_type)
+            }
 
-        # 1. Generate greeting
-        greeting_text = await self._generate_greeting(
+        # The greeting and transition are local, so their audio can start
+        # before any LLM text is ready
+        greeting = build_segment(SegmentType.GREETING, 1, await self._generate_greeting(
             company_name=company_name,
             job_title=job_title,
             candidate_name=candidate_name
-        )
-        segments.append({
-            "segment_type": SegmentType.GREETING.value,
-            "text": greeting_text,
-            "order": 1,
-            "duration_estimate_seconds": self._get_duration_estimate(SegmentType.GREETING)
-        })
-
-        # 2. Generate role overview
-        role_overview_text = await self._generate_role_overview(
-            job_description=job_description
-        )
-        segments.append({
-            "segment_type": SegmentType.ROLE_OVERVIEW.value,
-            "text": role_overview_text,
-            "order": 2,
-            "duration_estimate_seconds": self._get_duration_estimate(SegmentType.ROLE_OVERVIEW)
-        })
-
-        # 3. Generate responsibilities summary
+        ))
+        transition = build_segment(SegmentType.TRANSITION, 5, await self._generate_transition(job_title=job_title))
+        if audio:
+            audio.start([greeting, transition])
+
+        # The overview, responsibilities and requirements come from one
+        # structured LLM call, or straight from templates for sparse job
+        # descriptions
+        if self.skip_llm_when_simple and self._is_simple_job(job_description):
+            body_texts = await self._generate_template_segments(job_description)
+        else:
+            body_texts = await self._generate_all_segments_fused(
+                job_description,
+                include_first_question=fuse_first_question,
+                candidate_resume_summary=candidate_resume_summary
+            )
+
+        llm_jobs = [
+            (SegmentType.ROLE_OVERVIEW, 2, functools.partial(
+                self._generate_role_overview,
+                job_description=job_description
+            )),
+        ]
         if responsibilities:
-            responsibilities_text = await self._generate_responsibilities_summary(
+            llm_jobs.append((SegmentType.RESPONSIBILITIES, 3, functools.partial(
+                self._generate_responsibilities_summary,
                 responsibilities=responsibilities
-            )
-            segments.append({
-                "segment_type": SegmentType.RESPONSIBILITIES.value,
-                "text": responsibilities_text,
-                "order": 3,
-                "duration_estimate_seconds": self._get_duration_estimate(SegmentType.RESPONSIBILITIES)
-            })
-
-        # 4. Generate requirements summary
+            )))
         if requirements:
-            requirements_text = await self._generate_requirements_summary(
+            llm_jobs.append((SegmentType.REQUIREMENTS, 4, functools.partial(
+                self._generate_requirements_summary,
                 requirements=requirements,
                 nice_to_have=nice_to_have
+            )))
+
+        # Any segment the fused call did not return is generated on its own,
+        # concurrently; each generator falls back to template text on failure
+        missing = [job for job in llm_jobs if job[0].value not in body_texts]
+        fallback_texts = await asyncio.gather(*(generate() for _, _, generate in missing))
+        llm_texts = dict(body_texts)
+        llm_texts.update(
+            (segment_type.value, text)
+            for (segment_type, _, _), text in zip(missing, fallback_texts)
+        )
+
+        llm_segments = [
+            build_segment(segment_type, order, llm_texts[segment_type.value])
+            for segment_type, order, _ in llm_jobs
+        ]
+        if audio:
+            audio.start(llm_segments)
+
+        segments = [greeting, *llm_segments, transition]
+
+        first_question_text = body_texts.get(SegmentType.FIRST_QUESTION.value) if fuse_first_question else None
+        return segments, first_question_text
+
+    async def _generate_all_segments_fused(
+        self,
+        job_description: Dict,
+        include_first_question: bool = False,
+        candidate_resume_summary: str = None
+    ) -> Dict[str, str]:
+        """
+        Generate the role overview, responsibilities and requirements in one LLM call.
+
+        Args:
+            job_description: Full job description dict
+            include_first_question: Also generate the personalized first question
+                (returned under the "first_question" key)
+            candidate_resume_summary: Optional resume summary for the first question
+
+        Returns:
+            Dict of segment type value -> text for the segments the model
+            returned; empty when the call or JSON parsing fails
+        """
+        company_name = job_description.get("company_name", "the company")
+        job_title = job_description.get("job_title", "this role")
+        responsibilities = job_description.get("responsibilities", [])
+        requirements = job_description.get("requirements", [])
+        nice_to_have = job_description.get("nice_to_have", [])
+
+        sections = [
+            _JOB_DETAILS_SECTION.format(
+                job_title=job_title,
+                company_name=company_name,
+                context=self._build_role_context(job_description)
+            )
+        ]
+        if responsibilities:
+            sections.append(_RESPONSIBILITIES_SECTION.format(
+                responsibilities=_bullets(responsibilities[:4])
+            ))
+        if requirements:
+            sections.append(_REQUIREMENTS_SECTION.format(
+                requirements=_bullets(self._extract_top_skills(requirements, count=3)),
+                nice_to_have=_nice_to_have_section(
+                    self._extract_top_skills(nice_to_have, count=2) if nice_to_have else []
+                )
+            ))
+
+        instructions = _FUSED_SEGMENTS_INSTRUCTIONS
+        max_tokens = 400
+        if include_first_question:
+            instructions += "\n\n" + _FUSED_FIRST_QUESTION_INSTRUCTIONS
+            max_tokens += 80
+            matching_skills = _matching_skills(requirements, candidate_resume_summary)
+            if matching_skills:
+                sections.append(_CANDIDATE_SKILL_SECTION.format(skill_mention=matching_skills[0]))
+
+        prompt = instructions + "\n\n" + "\n\n".join(sections)
+
+        try:
+            content = await self._generate_cached(
+                "fused",
+                prompt,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
             )
-            segments.append({
-                "segment_type": SegmentType.REQUIREMENTS.value,
-                "text": requirements_text,
-                "order": 4,
-                "duration_estimate_seconds": self._get_duration_estimate(SegmentType.REQUIREMENTS)
-            })
-
-        # 5. Generate transition
-        transition_text = await self._generate_transition(job_title=job_title)
-        segments.append({
-            "segment_type": SegmentType.TRANSITION.value,
-            "text": transition_text,
-            "order": 5,
-            "duration_estimate_seconds": self._get_duration_estimate(SegmentType.TRANSITION)
-        })
-
-        # 6. Generate audio for all segments if requested
-        if generate_audio:
-            segments = await self._generate_audio_for_segments(segments)
+            data = json.loads(content)
+        except Exception as e:
+            print(f"Fused LLM generation failed, generating segments individually: {e}")
+            return {}
 
-        return segments
+        if not isinstance(data, dict):
+            return {}
+        return {
+            key: value.strip()
+            for key, value in data.items()
+            if isinstance(value, str) and value.strip()
+        }
+
+    def _is_simple_job(self, job_description: Dict) -> bool:
+        """Whether the JD is sparse enough that template text reads as well as LLM text."""
+        return (
+            not (job_description.get("company_description") or job_description.get("role_description"))
+            and len(job_description.get("responsibilities", [])) <= 3
+        )
+
+    async def _generate_template_segments(
+        self,
+        job_description: Dict
+    ) -> Dict[str, str]:
+        """
+        Build the overview, responsibilities and requirements from templates, without the LLM.
+
+        Args:
+            job_description: Full job description dict
+
+        Returns:
+            Dict of segment type value -> text, in the same shape as
+            _generate_all_segments_fused
+        """
+        responsibilities = job_description.get("responsibilities", [])
+        requirements = job_description.get("requirements", [])
+        nice_to_have = job_description.get("nice_to_have", [])
+
+        texts = {
+            SegmentType.ROLE_OVERVIEW.value: _role_overview_template(
+                job_description.get("company_name", "the company"),
+                job_description.get("job_title", "this role"),
+                job_description.get("team_name")
+            )
+        }
+        if responsibilities:
+            texts[SegmentType.RESPONSIBILITIES.value] = _responsibilities_template(responsibilities[:4])
+        if requirements:
+            texts[SegmentType.REQUIREMENTS.value] = _requirements_template(
+                self._extract_top_skills(requirements, count=3),
+                self._extract_top_skills(nice_to_have, count=2) if nice_to_have else []
+            )
+        return texts
+
+    def _build_role_context(self, job_description: Dict) -> str:
+        """Build the team/location/company/role context lines for overview prompts."""
+        team_name = job_description.get("team_name")
+        location = job_description.get("location")
+        company_description = job_description.get("company_description", "")
+        role_description = job_description.get("role_description", "")
+
+        context_parts = []
+        if team_name:
+            context_parts.append(f"Team: {team_name}")
+        if location:
+            context_parts.append(f"Location: {location}")
+        if company_description:
+            context_parts.append(f"Company: {company_description[:200]}")
+        if role_description:
+            context_parts.append(f"Role: {role_description[:300]}")
+
+        return "\n".join(context_parts) if context_parts else "General software engineering role"
 
     async def _generate_greeting(
         self,
@@ -259,40 +753,20 @@ class JobIntroductionGenerator:
         Returns:
             Greeting text string
         """
-        # Greeting variations
-        greetings_with_name = [
-            f"Hi {candidate_name}! Thanks for your interest in the {job_title} position at {company_name}.",
-            f"Hello {candidate_name}! Great to have you here for the {job_title} interview at {company_name}.",
-            f"Welcome, {candidate_name}! We're excited you're interested in the {job_title} role at {company_name}.",
-            f"Hi {candidate_name}, thanks for taking the time to interview for the {job_title} position at {company_name}.",
-        ]
-
-        greetings_without_name = [
-            f"Hi! Thanks for applying to {company_name} for the {job_title} role.",
-            f"Hello and welcome! Thanks for your interest in the {job_title} position at {company_name}.",
-            f"Welcome! We're excited you're interested in the {job_title} role at {company_name}.",
-            f"Hi there! Thanks for taking the time to interview for the {job_title} position at {company_name}.",
-            f"Great to have you here for the {job_title} interview at {company_name}.",
-        ]
-
         # Select appropriate greeting
         if candidate_name:
-            greetings = greetings_with_name
+            greetings = _GREETINGS_WITH_NAME
         else:
-            greetings = greetings_without_name
+            greetings = _GREETINGS_WITHOUT_NAME
 
         # Use personality service for variety if available
         if self.personality:
-            try:
-                # Use a hash of the company+job to get consistent but varied selection
-                seed = hash(f"{company_name}{job_title}") % len(greetings)
-                return greetings[seed]
-            except Exception:
-                pass
+            # Use a hash of the company+job to get consistent but varied selection
+            greeting = greetings[_stable_index(f"{company_name}{job_title}", len(greetings))]
+        else:
+            greeting = random.choice(greetings)
 
-        # Default to first greeting
-        import random
-        return random.choice(greetings)
+        return greeting.format(name=candidate_name, title=job_title, company=company_name)
 
     async def _generate_role_overview(
         self,
@@ -310,48 +784,23 @@ class JobIntroductionGenerator:
         company_name = job_description.get("company_name", "the company")
         job_title = job_description.get("job_title", "this role")
         team_name = job_description.get("team_name")
-        company_description = job_description.get("company_description", "")
-        role_description = job_description.get("role_description", "")
-        location = job_description.get("location")
 
         # Build context for LLM
-        context_parts = []
-        if team_name:
-            context_parts.append(f"Team: {team_name}")
-        if location:
-            context_parts.append(f"Location: {location}")
-        if company_description:
-            context_parts.append(f"Company: {company_description[:200]}")
-        if role_description:
-            context_parts.append(f"Role: {role_description[:300]}")
+        context = self._build_role_context(job_description)
 
-        context = "\n".join(context_parts) if context_parts else "General software engineering role"
-
-        prompt = f"""Generate a brief role overview for an interview (2-3 sentences max).
-
-Job Title: {job_title}
-Company: {company_name}
-{context}
-
-Write a natural, conversational overview that:
-- Mentions the team if available
-- Explains the high-level purpose of the role
-- Hints at impact/scope
-- Is warm and professional
-
-Example format: "This role is with our Backend Infrastructure Team. You'd be working on systems that power our core services, serving millions of users daily."
-
-Keep it concise and avoid buzzwords. Just the overview, no greeting or transition."""
+        prompt = _ROLE_OVERVIEW_PROMPT.format(
+            job_title=job_title,
+            company_name=company_name,
+            context=context
+        )
 
         try:
-            overview = await self.generate_with_llm(prompt, max_tokens=150)
+            overview = await self._generate_cached(SegmentType.ROLE_OVERVIEW.value, prompt, max_tokens=150)
             return overview.strip()
         except Exception as e:
             print(f"LLM generation failed for role overview: {e}")
             # Fallback to template
-            if team_name:
-                return f"This role is with the {team_name} at {company_name}. You'd be working on key projects that drive our core business objectives."
-            return f"As a {job_title} at {company_name}, you'll be contributing to impactful projects that matter to our organization."
+            return _role_overview_template(company_name, job_title, team_name)
 
     async def _generate_responsibilities_summary(
         self,
@@ -372,30 +821,15 @@ Keep it concise and avoid buzzwords. Just the overview, no greeting or transitio
         # Take top 3-4 responsibilities
         top_responsibilities = responsibilities[:4]
 
-        prompt = f"""Summarize these job responsibilities in natural, conversational sentences.
-
-Responsibilities:
-{chr(10).join(f'- {r}' for r in top_responsibilities)}
-
-Rules:
-- Combine into 2-3 flowing sentences (NOT bullet points)
-- Start with "Your main responsibilities would include..." or similar
-- Keep it under 30 seconds when spoken (roughly 75-80 words)
-- Be specific but concise
-- Make it sound engaging, not boring
-
-Just write the summary, nothing else."""
+        prompt = _RESPONSIBILITIES_PROMPT.format(responsibilities=_bullets(top_responsibilities))
 
         try:
-            summary = await self.generate_with_llm(prompt, max_tokens=120)
+            summary = await self._generate_cached(SegmentType.RESPONSIBILITIES.value, prompt, max_tokens=120)
             return summary.strip()
         except Exception as e:
             print(f"LLM generation failed for responsibilities: {e}")
             # Fallback to template
-            resp_list = ", ".join(top_responsibilities[:-1]) if len(top_responsibilities) > 1 else top_responsibilities[0]
-            if len(top_responsibilities) > 1:
-                resp_list += f", and {top_responsibilities[-1]}"
-            return f"Your main responsibilities would include {resp_list}."
+            return _responsibilities_template(top_responsibilities)
 
     async def _generate_requirements_summary(
         self,
@@ -419,34 +853,18 @@ Just write the summary, nothing else."""
         top_requirements = self._extract_top_skills(requirements, count=3)
         top_nice_to_have = self._extract_top_skills(nice_to_have, count=2) if nice_to_have else []
 
-        prompt = f"""Summarize these job requirements in a natural, encouraging way.
-
-Required qualifications:
-{chr(10).join(f'- {r}' for r in top_requirements)}
-
-{"Nice to have:" + chr(10) + chr(10).join(f'- {n}' for n in top_nice_to_have) if top_nice_to_have else ""}
-
-Rules:
-- Write 2-3 natural sentences (NOT bullet points)
-- Start with "We're looking for someone with..." or similar
-- Distinguish between required and nice-to-have if applicable
-- Be encouraging, not intimidating
-- Keep it under 25 seconds when spoken (roughly 60-65 words)
-
-Just write the summary, nothing else."""
+        prompt = _REQUIREMENTS_PROMPT.format(
+            requirements=_bullets(top_requirements),
+            nice_to_have=_nice_to_have_section(top_nice_to_have)
+        )
 
         try:
-            summary = await self.generate_with_llm(prompt, max_tokens=100)
+            summary = await self._generate_cached(SegmentType.REQUIREMENTS.value, prompt, max_tokens=100)
             return summary.strip()
         except Exception as e:
             print(f"LLM generation failed for requirements: {e}")
             # Fallback to template
-            req_text = ", ".join(top_requirements)
-            result = f"We're looking for someone with {req_text}."
-            if top_nice_to_have:
-                nice_text = " or ".join(top_nice_to_have)
-                result += f" If you've also worked with {nice_text}, that's a plus."
-            return result
+            return _requirements_template(top_requirements, top_nice_to_have)
 
     async def _generate_transition(
         self,
@@ -461,26 +879,13 @@ Just write the summary, nothing else."""
         Returns:
             Transition text leading into first question
         """
-        transitions = [
-            "Now that you understand what we're looking for, let's talk about your background.",
-            "With that context in mind, I'd love to hear about your experience.",
-            f"Let's dive into your qualifications for this {job_title} role.",
-            "With that overview, let's get to know you better.",
-            "Now, let's talk about you and your experience.",
-            "That's what we're looking for. Now, tell me about yourself.",
-            "With that context, let's discuss how your background fits.",
-        ]
-
         # Use personality for variety if available
         if self.personality:
-            try:
-                seed = hash(job_title) % len(transitions)
-                return transitions[seed]
-            except Exception:
-                pass
+            transition = _TRANSITIONS[_stable_index(job_title, len(_TRANSITIONS))]
+        else:
+            transition = random.choice(_TRANSITIONS)
 
-        import random
-        return random.choice(transitions)
+        return transition.format(title=job_title)
 
     async def generate_personalized_first_question(
         self,
@@ -505,47 +910,18 @@ Just write the summary, nothing else."""
         requirements = job_description.get("requirements", [])
 
         # If we have resume summary, try to find matching skills
-        matching_skills = []
-        if candidate_resume_summary and requirements:
-            # Simple keyword matching
-            resume_lower = candidate_resume_summary.lower()
-            for req in requirements[:5]:
-                req_words = req.lower().split()
-                for word in req_words:
-                    if len(word) > 3 and word in resume_lower:
-                        # Found a matching skill
-                        matching_skills.append(req)
-                        break
+        matching_skills = _matching_skills(requirements, candidate_resume_summary)
 
         # Generate question based on context
         if matching_skills:
             skill_mention = matching_skills[0]
-            prompt = f"""Generate a personalized first interview question.
-
-Job: {job_title} at {company_name}
-Candidate has experience with: {skill_mention}
-
-Create a first question that:
-- Starts like "Tell me about yourself..."
-- Ties their experience to the role
-- Is warm and engaging
-
-Example: "I see you have experience with distributed systems. Tell me about yourself and how that experience relates to what we're building here."
-
-Write only the question, nothing else."""
+            prompt = _FIRST_QUESTION_WITH_SKILL_PROMPT.format(
+                job_title=job_title,
+                company_name=company_name,
+                skill_mention=skill_mention
+            )
         else:
-            prompt = f"""Generate a personalized first interview question.
-
-Job: {job_title} at {company_name}
-
-Create a first question that:
-- Starts like "Tell me about yourself..."
-- Asks what attracted them to this specific role
-- Is warm and engaging
-
-Example: "Tell me about yourself and specifically what attracted you to the {job_title} position at {company_name}."
-
-Write only the question, nothing else."""
+            prompt = _FIRST_QUESTION_PROMPT.format(job_title=job_title, company_name=company_name)
 
         try:
             question = await self.generate_with_llm(prompt, max_tokens=80)
@@ -557,39 +933,38 @@ Write only the question, nothing else."""
                 return f"I see you have relevant experience. Tell me about yourself and how your background relates to what we're looking for in a {job_title}."
             return f"Tell me about yourself and specifically what attracted you to the {job_title} position at {company_name}."
 
-    async def _generate_audio_for_segments(
+    def _new_audio_batch(self) -> Optional["_AudioBatch"]:
+        """Start a TTS batch for one introduction, or None when TTS is unavailable."""
+        if not self.tts_service:
+            print("TTS service not available, skipping audio generation")
+            return None
+        return _AudioBatch(self, self.MAX_CONCURRENT_TTS)
+
+    async def _generate_segment_audio(
         self,
-        segments: List[Dict]
-    ) -> List[Dict]:
+        segment: Dict,
+        cache_key: Optional[str],
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
         """
-        Generate TTS audio for all segments.
+        Generate TTS audio for one segment.
 
         Args:
-            segments: List of segment dicts with 'text' field
+            segment: Segment dict with 'text' field
+            cache_key: TTS cache key for the segment text, None when it has no text
+            semaphore: Limits how many TTS requests are in flight
 
         Returns:
-            Enhanced segments with 'audio_url' fields populated
+            The segment, with 'audio_url' populated when audio was generated
         """
-        if not self.tts_service:
-            print("TTS service not available, skipping audio generation")
-            return segments
-
-        enhanced_segments = []
+        if not cache_key:
+            return segment
 
-        for segment in segments:
-            try:
-                text = segment.get("text", "")
-                segment_type = segment.get("segment_type", "intro")
-
-                if not text:
-                    enhanced_segments.append(segment)
-                    continue
-
-                # Generate cache key based on text content
-                text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-                cache_key = f"intro_{segment_type}_{text_hash}"
+        try:
+            text = segment["text"]
 
-                # Generate audio with caching
+            # Generate audio with caching
+            async with semaphore:
                 audio_bytes, audio_path = await self.tts_service.generate_and_cache(
                     text=text,
                     cache_key=cache_key,
@@ -597,24 +972,21 @@ Write only the question, nothing else."""
                     speed=self.audio_speed
                 )
 
-                if audio_path:
-                    # Extract just the filename for the URL
-                    filename = os.path.basename(audio_path)
-                    segment["audio_url"] = f"/api/audio/{filename}"
-
-                    # Update duration estimate based on audio length
-                    if audio_bytes:
-                        # Rough estimate: MP3 at 128kbps = 16KB per second
-                        estimated_duration = len(audio_bytes) / 16000
-                        segment["duration_estimate_seconds"] = round(estimated_duration, 1)
+            if audio_path:
+                # Extract just the filename for the URL
+                filename = os.path.basename(audio_path)
+                segment["audio_url"] = f"/api/audio/{filename}"
 
-                enhanced_segments.append(segment)
+                # Update duration estimate based on audio length
+                if audio_bytes:
+                    # Rough estimate: MP3 at 128kbps = 16KB per second
+                    estimated_duration = len(audio_bytes) / 16000
+                    segment["duration_estimate_seconds"] = round(estimated_duration, 1)
 
-            except Exception as e:
-                print(f"Failed to generate audio for segment {segment.get('segment_type')}: {e}")
-                enhanced_segments.append(segment)
+        except Exception as e:
+            print(f"Failed to generate audio for segment {segment.get('segment_type')}: {e}")
 
-        return enhanced_segments
+        return segment
 
     def _extract_top_skills(
         self,
@@ -639,49 +1011,13 @@ Write only the question, nothing else."""
         if not requirements:
             return []
 
-        # Score each requirement
-        scored = []
-        for req in requirements:
-            score = 0
-            req_lower = req.lower()
-
-            # Prioritize years of experience
-            if "year" in req_lower or "yr" in req_lower:
-                score += 10
-
-            # Prioritize specific technologies/skills
-            tech_keywords = [
-                "python", "java", "javascript", "react", "node", "sql", "aws",
-                "kubernetes", "docker", "api", "microservices", "system design",
-                "machine learning", "data", "cloud", "agile", "ci/cd"
-            ]
-            for tech in tech_keywords:
-                if tech in req_lower:
-                    score += 5
-                    break
-
-            # Prioritize "must have" or "required" keywords
-            if "must" in req_lower or "required" in req_lower or "essential" in req_lower:
-                score += 8
-
-            # Prioritize degree requirements
-            if "degree" in req_lower or "bachelor" in req_lower or "master" in req_lower:
-                score += 6
-
-            # Shorter requirements are often more specific/important
-            if len(req) < 50:
-                score += 2
-
-            scored.append((score, req))
-
-        # Sort by score descending and return top N
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [req for score, req in scored[:count]]
+        return list(_top_skills(tuple(requirements), count))
 
     async def generate_with_llm(
         self,
         prompt: str,
-        max_tokens: int = 200
+        max_tokens: int = 200,
+        response_format: Optional[Dict] = None
     ) -> str:
         """
         Use OpenAI to generate natural introduction text.
@@ -689,26 +1025,22 @@ Write only the question, nothing else."""
         Args:
             prompt: The prompt for generation
             max_tokens: Maximum tokens in response
+            response_format: Optional OpenAI response_format (e.g. JSON mode)
 
         Returns:
             Generated text string
         """
+        extra = {"response_format": response_format} if response_format else {}
         try:
-            response = self.client.chat.completions.create(
+            response = await self._create_completion(
                 model="gpt-4o-mini",
                 temperature=0.7,
                 max_tokens=max_tokens,
+                **extra,
                 messages=[
                     {
                         "role": "system",
-                        "content": """You are a professional, warm interviewer introducing job roles.
-Your tone is:
-- Professional but friendly
-- Welcoming and encouraging
-- Clear and concise
-- Not overwhelming or intimidating
-
-Keep responses brief and natural-sounding when spoken aloud."""
+                        "content": _SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -717,24 +1049,127 @@ Keep responses brief and natural-sounding when spoken aloud."""
                 ]
             )
 
+            # Track prompt-cache hits on the shared instruction prefix
+            usage = getattr(response, "usage", None)
+            details = getattr(usage, "prompt_tokens_details", None)
+            self.cached_prompt_tokens += getattr(details, "cached_tokens", None) or 0
+
             return response.choices[0].message.content.strip()
 
         except Exception as e:
             print(f"OpenAI generation failed: {e}")
             raise
 
+    async def _create_completion(self, **kwargs):
+        """
+        Create a chat completion, limiting concurrency and backing off on 429s.
+
+        Retries mirror call_openai_with_backoff in api.py; the slot is held
+        while backing off so a rate-limited process stops adding load.
+        """
+        async with _llm_semaphore:
+            for attempt in range(LLM_RATE_LIMIT_RETRIES):
+                try:
+                    return await self.client.chat.completions.create(**kwargs)
+                except RateLimitError:
+                    wait = min(20, 2 ** attempt) + random.random()
+                    print(f"[WARN] Rate limit hit. Retrying in {wait:.1f}s...")
+                    await asyncio.sleep(wait)
+            # Final attempt (let it raise if still failing)
+            return await self.client.chat.completions.create(**kwargs)
+
+    async def _generate_cached(
+        self,
+        segment_type: str,
+        prompt: str,
+        max_tokens: int = 200,
+        response_format: Optional[Dict] = None
+    ) -> str:
+        """
+        Generate text with generate_with_llm, reusing cached text for the same prompt.
+
+        The prompt already carries every job field the segment depends on, so
+        (segment type, mode, prompt) identifies the output. Only successful
+        generations are cached; template fallbacks are not.
+
+        Args:
+            segment_type: Segment the text is for (part of the cache key)
+            prompt: The prompt for generation
+            max_tokens: Maximum tokens in response
+            response_format: Optional OpenAI response_format (e.g. JSON mode)
+
+        Returns:
+            Generated text string
+        """
+        key_input = json.dumps(
+            {"segment": segment_type, "mode": self.mode.value, "prompt": prompt},
+            sort_keys=True
+        )
+        cache_path = self.text_cache_dir / f"{hashlib.blake2b(key_input.encode()).hexdigest()}.txt"
+
+        cached = await asyncio.to_thread(self._read_cached_text, cache_path)
+        if cached is not None:
+            return cached
+
+        text = await self.generate_with_llm(prompt, max_tokens=max_tokens, response_format=response_format)
+
+        try:
+            if response_format:
+                json.loads(text)  # Don't cache malformed JSON
+            await asyncio.to_thread(self._write_cached_text, cache_path, text)
+        except (OSError, ValueError) as e:
+            print(f"Could not cache segment text: {e}")
+
+        return text
+
+    def _read_cached_text(self, cache_path: Path) -> Optional[str]:
+        """Read cached segment text, or None if it is missing or expired (blocking)."""
+        try:
+            if time.time() - cache_path.stat().st_mtime < TEXT_CACHE_TTL_SECONDS:
+                return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        return None
+
+    def _write_cached_text(self, cache_path: Path, text: str) -> None:
+        """Write segment text to the cache, then clean up the cache (blocking)."""
+        cache_path.write_text(text, encoding="utf-8")
+        self._cleanup_text_cache()
+
+    def _cleanup_text_cache(self):
+        """Remove expired cached texts, then the oldest ones beyond max_text_cache_files."""
+        try:
+            cache_files = []
+            now = time.time()
+            for file_path in self.text_cache_dir.glob("*.txt"):
+                mtime = file_path.stat().st_mtime
+                if now - mtime >= TEXT_CACHE_TTL_SECONDS:
+                    file_path.unlink()
+                else:
+                    cache_files.append((mtime, file_path))
+
+            if len(cache_files) <= self.max_text_cache_files:
+                return
+
+            # Remove oldest files
+            cache_files.sort()
+            for _, file_path in cache_files[:len(cache_files) - self.max_text_cache_files]:
+                file_path.unlink()
+
+        except OSError as e:
+            print(f"Text cache cleanup error: {e}")
+
     def _get_duration_estimate(self, segment_type: SegmentType) -> int:
         """Get duration estimate for a segment type based on mode."""
-        return SEGMENT_DURATIONS.get(self.mode, SEGMENT_DURATIONS[IntroductionMode.CONCISE]).get(
-            segment_type, 5
-        )
+        return self._durations.get(segment_type, 5)
 
     async def generate_full_introduction_with_audio(
         self,
         job_description: Dict,
         candidate_name: str = None,
         candidate_resume_summary: str = None,
-        include_first_question: bool = True
+        include_first_question: bool = True,
+        fuse_first_question: bool = True
     ) -> Dict:
         """
         Generate complete introduction package with all segments and audio.
@@ -746,6 +1181,8 @@ Keep responses brief and natural-sounding when spoken aloud."""
             candidate_name: Optional candidate name
             candidate_resume_summary: Optional resume summary
             include_first_question: Whether to include personalized first question
+            fuse_first_question: Generate the first question in the same LLM call
+                as the segments, falling back to a separate call when it is missing
 
         Returns:
             Dict with:
@@ -756,30 +1193,27 @@ Keep responses brief and natural-sounding when spoken aloud."""
                 "mode": "concise" or "detailed"
             }
         """
-        # Generate opening sequence
-        segments = await self.generate_opening_sequence(
-            job_description=job_description,
-            candidate_name=candidate_name,
+        self._ensure_services()
+
+        # Generate opening sequence text, with the first question from the
+        # same LLM call when fused; each segment's audio starts as soon as
+        # its text is ready
+        audio = self._new_audio_batch()
+        segments, first_q_text = await self._build_opening_segments(
+            job_description,
+            candidate_name,
+            fuse_first_question=include_first_question and fuse_first_question,
             candidate_resume_summary=candidate_resume_summary,
-            generate_audio=True
+            audio=audio
         )
 
-        # Calculate total duration
-        total_duration = sum(s.get("duration_estimate_seconds", 5) for s in segments)
-
-        result = {
-            "segments": segments,
-            "first_question": None,
-            "total_duration_seconds": total_duration,
-            "mode": self.mode.value
-        }
-
-        # Generate first question if requested
+        first_question = None
         if include_first_question:
-            first_q_text = await self.generate_personalized_first_question(
-                job_description=job_description,
-                candidate_resume_summary=candidate_resume_summary
-            )
+            if not first_q_text:
+                first_q_text = await self.generate_personalized_first_question(
+                    job_description=job_description,
+                    candidate_resume_summary=candidate_resume_summary
+                )
 
             first_question = {
                 "segment_type": SegmentType.FIRST_QUESTION.value,
@@ -788,28 +1222,23 @@ Keep responses brief and natural-sounding when spoken aloud."""
                 "duration_estimate_seconds": 8
             }
 
-            # Generate audio for first question
-            if self.tts_service:
-                try:
-                    text_hash = hashlib.md5(first_q_text.encode()).hexdigest()[:8]
-                    cache_key = f"intro_first_question_{text_hash}"
-
-                    audio_bytes, audio_path = await self.tts_service.generate_and_cache(
-                        text=first_q_text,
-                        cache_key=cache_key,
-                        voice=self.audio_voice,
-                        speed=self.audio_speed
-                    )
+            if audio:
+                audio.start([first_question])
 
-                    if audio_path:
-                        filename = os.path.basename(audio_path)
-                        first_question["audio_url"] = f"/api/audio/{filename}"
+        if audio:
+            await audio.wait()
 
-                except Exception as e:
-                    print(f"Failed to generate audio for first question: {e}")
+        # Calculate total duration
+        total_duration = sum(s.get("duration_estimate_seconds", 5) for s in segments)
+        if first_question:
+            total_duration += first_question["duration_estimate_seconds"]
 
-            result["first_question"] = first_question
-            result["total_duration_seconds"] += first_question["duration_estimate_seconds"]
+        result = {
+            "segments": segments,
+            "first_question": first_question,
+            "total_duration_seconds": total_duration,
+            "mode": self.mode.value
+        }
 
         return result
 
@@ -12,6 +12,7 @@ interview transcripts, providing high-quality, battle-tested questions.
 import json
 import random
 import logging
+import functools
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
@@ -19,6 +20,51 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Normalization depends only on the input string and the class mappings, and
+# the same few role/difficulty/intent strings recur on every question, so the
+# results are memoized.
+
+@functools.lru_cache(maxsize=512)
+def _mapped_role(role: str) -> Optional[str]:
+    """ROLE_MAPPINGS value for a role by exact, then partial match; None if unmapped."""
+    role_lower = role.lower().strip()
+    mappings = QuestionSelector.ROLE_MAPPINGS
+
+    # Direct mapping
+    if role_lower in mappings:
+        return mappings[role_lower]
+
+    # Partial matching
+    for key, value in mappings.items():
+        if key in role_lower or role_lower in key:
+            return value
+
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _normalized_difficulty(difficulty: str) -> str:
+    """DIFFICULTY_MAPPINGS value for a difficulty, defaulting to medium."""
+    return QuestionSelector.DIFFICULTY_MAPPINGS.get(difficulty.lower().strip(), "medium")
+
+
+@functools.lru_cache(maxsize=512)
+def _normalized_intent(intent: str) -> str:
+    """Question bank intent key for an intent string."""
+    intent_lower = intent.lower().strip().replace("-", "_")
+
+    # Direct mapping
+    if intent_lower in QuestionSelector.INTENT_MAPPINGS:
+        return QuestionSelector.INTENT_MAPPINGS[intent_lower]
+
+    # Already in snake_case format
+    if "_" in intent_lower:
+        return intent_lower
+
+    # Convert to snake_case
+    return intent_lower.replace(" ", "_")
+
+
 class QuestionSelector:
     """
     Selects questions from the pre-built question bank.
@@ -578,19 +624,13 @@ class QuestionSelector:
         if not role:
             return "software_engineer"
 
-        role_lower = role.lower().strip()
-
-        # Direct mapping
-        if role_lower in self.ROLE_MAPPINGS:
-            return self.ROLE_MAPPINGS[role_lower]
+        # Direct or partial mapping
+        mapped = _mapped_role(role)
+        if mapped is not None:
+            return mapped
 
-        # Partial matching
-        for key, value in self.ROLE_MAPPINGS.items():
-            if key in role_lower or role_lower in key:
-                return value
-
-        # Check if role exists in question bank
-        role_snake = role_lower.replace(" ", "_").replace("-", "_")
+        # Check if role exists in question bank (not memoized: the bank is per instance)
+        role_snake = role.lower().strip().replace(" ", "_").replace("-", "_")
         if role_snake in self.question_bank:
             return role_snake
 
@@ -601,26 +641,14 @@ class QuestionSelector:
         if not difficulty:
             return "medium"
 
-        diff_lower = difficulty.lower().strip()
-        return self.DIFFICULTY_MAPPINGS.get(diff_lower, "medium")
+        return _normalized_difficulty(difficulty)
 
     def _normalize_intent(self, intent: str) -> str:
         """Normalize intent to match question bank keys."""
         if not intent:
             return "technical_skills"
 
-        intent_lower = intent.lower().strip().replace("-", "_")
-
-        # Direct mapping
-        if intent_lower in self.INTENT_MAPPINGS:
-            return self.INTENT_MAPPINGS[intent_lower]
-
-        # Already in snake_case format
-        if "_" in intent_lower:
-            return intent_lower
-
-        # Convert to snake_case
-        return intent_lower.replace(" ", "_")
+        return _normalized_intent(intent)
 
     def _get_questions_for_category(
         self,
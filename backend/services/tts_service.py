@@ -18,8 +18,10 @@ import os
 import logging
 import hashlib
 import asyncio
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any, Union
 from uuid import uuid4
 from datetime import datetime, timezone
 
@@ -93,6 +95,13 @@ class TTSService:
         "probe": {"voice": "echo", "speed": 0.95, "model": MODEL_STANDARD}
     }
 
+    # Bytes per chunk when streaming audio to the client
+    STREAM_CHUNK_SIZE = 4096
+
+    # Recently saved clips kept in memory so /api/audio can skip the disk read
+    RECENT_AUDIO_MAX_ITEMS = 256
+    RECENT_AUDIO_TTL_SECONDS = 300
+
     # Stage adjustments (multipliers for speed)
     STAGE_ADJUSTMENTS = {
         "early": 0.95,  # Slightly slower, more formal
@@ -135,6 +144,9 @@ class TTSService:
         self._cache_index: Dict[str, str] = {}
         self._load_cache_index()
 
+        # filename -> (audio bytes, monotonic save time), oldest first
+        self._recent_audio: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+
         logger.info(f"TTSService initialized with cache at {self.cache_dir}")
         logger.info(f"Using model: {self.default_model}")
 
@@ -289,6 +301,105 @@ class TTSService:
         """
         logger.info(f"Generating interview TTS: context={context_type}, stage={conversation_stage}, voice_override={voice_override}")
 
+        params = self._interview_context_params(text, context_type, conversation_stage, voice_override)
+        return await self.generate_speech(**params)
+
+    async def stream_for_interview_context(
+        self,
+        text: str,
+        context_type: str,
+        conversation_stage: str = "mid",
+        voice_override: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech optimized for interview context as it is synthesized.
+
+        Streaming counterpart of generate_for_interview_context.
+
+        Args:
+            text: Text to speak
+            context_type: Type of content (question, acknowledgment, follow_up, etc.)
+            conversation_stage: Interview stage (early, mid, late)
+            voice_override: If provided, overrides the per-context voice
+
+        Yields:
+            Audio byte chunks
+        """
+        logger.info(f"Streaming interview TTS: context={context_type}, stage={conversation_stage}, voice_override={voice_override}")
+
+        params = self._interview_context_params(text, context_type, conversation_stage, voice_override)
+        async for chunk in self.stream_speech(**params):
+            yield chunk
+
+    async def stream_speech(
+        self,
+        text: str,
+        voice: str = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        model: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech from the OpenAI TTS API chunk by chunk.
+
+        Unlike generate_speech, audio is yielded as soon as the API produces it,
+        so playback can start before synthesis of the full text finishes.
+
+        Args:
+            text: The text to convert to speech
+            voice: OpenAI voice option (alloy, echo, fable, onyx, nova, shimmer)
+            speed: Speech rate (0.25 to 4.0), default 1.0
+            output_format: Output format (mp3, opus, aac, flac)
+            model: TTS model to use (tts-1 or tts-1-hd)
+
+        Yields:
+            Audio byte chunks in the specified format
+
+        Raises:
+            ValueError: If text is empty
+        """
+        if not text or not text.strip():
+            logger.warning("Empty text provided to TTS")
+            raise ValueError("Text cannot be empty")
+
+        text = text[:self.MAX_TEXT_LENGTH]
+        if voice not in self.VOICES:
+            voice = "alloy"
+        if output_format not in self.FORMATS:
+            output_format = "mp3"
+        speed = max(self.MIN_SPEED, min(self.MAX_SPEED, speed))
+
+        logger.info(f"Streaming TTS: voice={voice}, speed={speed}, format={output_format}")
+
+        async with self.client.audio.speech.with_streaming_response.create(
+            model=model or self.default_model,
+            voice=voice,
+            input=text,
+            speed=speed,
+            response_format=output_format
+        ) as response:
+            async for chunk in response.iter_bytes(self.STREAM_CHUNK_SIZE):
+                yield chunk
+
+    def _interview_context_params(
+        self,
+        text: str,
+        context_type: str,
+        conversation_stage: str,
+        voice_override: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Resolve text, voice, speed and model for an interview context.
+
+        Args:
+            text: Text to speak
+            context_type: Type of content (question, acknowledgment, follow_up, etc.)
+            conversation_stage: Interview stage (early, mid, late)
+            voice_override: If provided, overrides the per-context voice
+
+        Returns:
+            Keyword arguments for generate_speech / stream_speech
+        """
         # Get context configuration
         context_config = self.CONTEXT_MAPPING.get(
             context_type,
@@ -316,12 +427,12 @@ class TTSService:
 
         logger.info(f"Interview TTS params: voice={voice}, speed={final_speed:.2f}")
 
-        return await self.generate_speech(
-            text=adjusted_text,
-            voice=voice,
-            speed=final_speed,
-            model=model
-        )
+        return {
+            "text": adjusted_text,
+            "voice": voice,
+            "speed": final_speed,
+            "model": model
+        }
 
     async def save_audio_file(
         self,
@@ -345,7 +456,7 @@ class TTSService:
         save_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate unique filename
-        unique_id = str(uuid4())[:8]
+        unique_id = uuid4().hex[:8]
         safe_filename = self._sanitize_filename(filename)
         full_filename = f"{safe_filename}_{unique_id}.mp3"
         file_path = save_dir / full_filename
@@ -355,6 +466,10 @@ class TTSService:
             with open(file_path, "wb") as f:
                 f.write(audio_bytes)
 
+            # Keep a copy in memory for the audio endpoint (it only serves cache_dir)
+            if save_dir == self.cache_dir:
+                self._remember_audio(full_filename, audio_bytes)
+
             logger.info(f"Audio saved: {file_path}")
             return str(file_path)
 
@@ -362,6 +477,33 @@ class TTSService:
             logger.error(f"Failed to save audio file: {e}")
             raise
 
+    def get_recent_audio(self, filename: str) -> Optional[bytes]:
+        """
+        Get a recently saved clip from memory.
+
+        Args:
+            filename: Saved audio filename (basename, with extension)
+
+        Returns:
+            Audio bytes, or None if not in memory or expired (serve from disk instead)
+        """
+        entry = self._recent_audio.get(filename)
+        if entry is None:
+            return None
+
+        audio_bytes, saved_at = entry
+        if time.monotonic() - saved_at > self.RECENT_AUDIO_TTL_SECONDS:
+            del self._recent_audio[filename]
+            return None
+
+        return audio_bytes
+
+    def _remember_audio(self, filename: str, audio_bytes: bytes) -> None:
+        """Store a saved clip in memory, evicting the oldest clips beyond the limit."""
+        self._recent_audio[filename] = (audio_bytes, time.monotonic())
+        while len(self._recent_audio) > self.RECENT_AUDIO_MAX_ITEMS:
+            self._recent_audio.popitem(last=False)
+
     async def generate_and_cache(
         self,
         text: str,
@@ -423,7 +565,7 @@ class TTSService:
             True if should generate audio, False otherwise
         """
         # Never speak if no text
-        if not text or not text.strip():
+        if not text or text.isspace():
             return False
 
         # Context-based rules
@@ -485,7 +627,7 @@ class TTSService:
         async def generate_one(item: Dict[str, str]) -> Dict[str, Any]:
             """Generate TTS for a single item with semaphore."""
             async with semaphore:
-                item_id = item.get("id", str(uuid4())[:8])
+                item_id = item.get("id") or uuid4().hex[:8]
                 text = item.get("text", "")
                 context = item.get("context", "general")
 
@@ -533,6 +675,45 @@ class TTSService:
 
         return results
 
+    async def generate_interview_batch(
+        self,
+        items: List[Tuple[str, str, str]],
+        voice_override: Optional[str] = None,
+        max_concurrent: int = 3
+    ) -> List[Union[bytes, Exception]]:
+        """
+        Generate interview-context speech for all clips of a turn in one call.
+
+        OpenAI's speech endpoint accepts a single input per request, so the
+        clips are synthesized concurrently rather than in one upstream call.
+
+        Args:
+            items: List of (text, context_type, conversation_stage) tuples
+            voice_override: Voice applied to every clip (see generate_for_interview_context)
+            max_concurrent: Maximum concurrent API calls
+
+        Returns:
+            Audio bytes per item in input order; the raised Exception for failed items
+        """
+        if not items:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate_one(text: str, context_type: str, conversation_stage: str) -> bytes:
+            async with semaphore:
+                return await self.generate_for_interview_context(
+                    text,
+                    context_type,
+                    conversation_stage,
+                    voice_override=voice_override
+                )
+
+        return await asyncio.gather(
+            *(generate_one(*item) for item in items),
+            return_exceptions=True
+        )
+
     def _select_voice_for_context(
         self,
         context_type: str,
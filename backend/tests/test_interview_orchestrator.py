@@ -0,0 +1,218 @@
+"""
+Test suite for InterviewOrchestrator's in-memory task bookkeeping.
+
+This module tests, with all collaborators mocked:
+- Identical concurrent next-question generations share one underlying call
+- The shared generation survives until its last waiter is cancelled
+- Speculative next questions parked across a follow-up probe expire and are cancelled
+
+Run tests with: pytest backend/tests/test_interview_orchestrator.py -v
+"""
+
+import pytest
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.interview_orchestrator import InterviewOrchestrator
+
+
+# ============================================================================
+# FIXTURES - Reusable test setup components
+# ============================================================================
+
+@pytest.fixture
+def orchestrator():
+    """Orchestrator whose collaborators are all mocks."""
+    return InterviewOrchestrator(
+        question_generator=MagicMock(),
+        decision_engine=MagicMock(),
+        interviewer_personality=MagicMock(),
+        realtime_response_generator=MagicMock(),
+        tts_service=MagicMock()
+    )
+
+
+@pytest.fixture
+def gated_generation(orchestrator):
+    """
+    Replace the uncoalesced generation with one that blocks until released.
+
+    Returns a namespace with the call count, the release event, and the
+    cancelled flag of the underlying generation.
+    """
+    state = MagicMock(calls=0, cancelled=False)
+    state.release = asyncio.Event()
+
+    async def fake_generation(session_id, current_question_number, *args):
+        state.calls += 1
+        try:
+            await state.release.wait()
+        except asyncio.CancelledError:
+            state.cancelled = True
+            raise
+        return {"question": {"text": f"Question {current_question_number}"}, "audio": None}
+
+    orchestrator._generate_question_with_audio = fake_generation
+    return state
+
+
+def pending_task():
+    """A task that stays pending until cancelled."""
+    return asyncio.create_task(asyncio.sleep(3600))
+
+
+# ============================================================================
+# TEST CASES - single-flight generate_question_with_audio
+# ============================================================================
+
+class TestSingleFlightQuestionGeneration:
+    """Tests for coalescing identical concurrent generate_question_with_audio calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_generation(self, orchestrator, gated_generation):
+        """Two identical calls make one underlying call and get separate copies."""
+        session_id = uuid4()
+        first = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        second = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        await asyncio.sleep(0)
+
+        gated_generation.release.set()
+        first_result, second_result = await asyncio.gather(first, second)
+
+        assert gated_generation.calls == 1
+        assert first_result == second_result
+        assert first_result is not second_result
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_are_not_coalesced(self, orchestrator, gated_generation):
+        """Calls for different questions each run their own generation."""
+        session_id = uuid4()
+        gated_generation.release.set()
+        await asyncio.gather(
+            orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"),
+            orchestrator.generate_question_with_audio(session_id, 3, "swe", "medium")
+        )
+
+        assert gated_generation.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_shared_generation(self, orchestrator, gated_generation):
+        """Cancelling one of two waiters leaves the shared task running for the other."""
+        session_id = uuid4()
+        first = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        second = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert not gated_generation.cancelled
+
+        gated_generation.release.set()
+        result = await second
+        assert result["question"]["text"] == "Question 2"
+        assert gated_generation.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_last_waiter_cancels_generation(self, orchestrator, gated_generation):
+        """Once every waiter is cancelled, the shared task is cancelled too."""
+        session_id = uuid4()
+        first = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        second = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        await asyncio.sleep(0)
+        shared = next(iter(orchestrator._inflight_questions.values()))
+
+        first.cancel()
+        second.cancel()
+        for waiter in (first, second, shared):
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert gated_generation.cancelled
+        assert not orchestrator._inflight_questions
+        assert not orchestrator._inflight_waiters
+
+    @pytest.mark.asyncio
+    async def test_key_is_removed_when_generation_finishes(self, orchestrator, gated_generation):
+        """Finished generations leave no in-flight task or waiter count behind."""
+        session_id = uuid4()
+        call = asyncio.create_task(orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium"))
+        await asyncio.sleep(0)
+        assert len(orchestrator._inflight_questions) == 1
+
+        gated_generation.release.set()
+        await call
+
+        assert not orchestrator._inflight_questions
+        assert not orchestrator._inflight_waiters
+
+        # A later identical call starts a fresh generation
+        await orchestrator.generate_question_with_audio(session_id, 2, "swe", "medium")
+        assert gated_generation.calls == 2
+
+
+# ============================================================================
+# TEST CASES - parked speculative next questions
+# ============================================================================
+
+class TestPrefetchedQuestions:
+    """Tests for _park_prefetched_question / _take_prefetched_question."""
+
+    @pytest.mark.asyncio
+    async def test_take_returns_parked_task_once(self, orchestrator):
+        """A parked task is handed out for its question number, then forgotten."""
+        session_id = uuid4()
+        task = pending_task()
+        orchestrator._park_prefetched_question(session_id, 3, task)
+
+        assert orchestrator._take_prefetched_question(session_id, 3) is task
+        assert orchestrator._take_prefetched_question(session_id, 3) is None
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_take_cancels_task_for_other_question(self, orchestrator):
+        """A parked task for a different question number is stale."""
+        session_id = uuid4()
+        task = pending_task()
+        orchestrator._park_prefetched_question(session_id, 3, task)
+
+        assert orchestrator._take_prefetched_question(session_id, 5) is None
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_swept_and_cancelled(self, orchestrator):
+        """Parking a task evicts and cancels entries older than the TTL."""
+        abandoned, active = uuid4(), uuid4()
+        abandoned_task, active_task = pending_task(), pending_task()
+        orchestrator._park_prefetched_question(abandoned, 2, abandoned_task)
+
+        orchestrator.PREFETCH_TTL_SECONDS = 0
+        orchestrator._park_prefetched_question(active, 2, active_task)
+        await asyncio.sleep(0)
+
+        assert abandoned_task.cancelled()
+        assert list(orchestrator._prefetch) == [active]
+        active_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_entries_are_capped(self, orchestrator):
+        """The oldest entry is evicted once MAX_PREFETCH_ENTRIES is reached."""
+        orchestrator.MAX_PREFETCH_ENTRIES = 2
+        sessions = [uuid4() for _ in range(3)]
+        tasks = [pending_task() for _ in range(3)]
+        for session_id, task in zip(sessions, tasks):
+            orchestrator._park_prefetched_question(session_id, 2, task)
+        await asyncio.sleep(0)
+
+        assert list(orchestrator._prefetch) == sessions[1:]
+        assert tasks[0].cancelled()
+        assert not tasks[1].cancelled() and not tasks[2].cancelled()
+        for task in tasks[1:]:
+            task.cancel()
@@ -144,6 +144,21 @@ class TestTTSService:
 
         assert successes >= 3, f"Interview context failures: {successes}/{len(contexts)}"
 
+    @pytest.mark.asyncio
+    async def test_interview_batch(self, tts):
+        """Interview batch returns one result per item, in order, with failures in place."""
+        items = [
+            ("That's a great example.", "acknowledgment", "mid"),
+            ("", "follow_up", "mid"),  # empty text must fail without affecting the others
+            ("Let's move on to the next topic.", "transition", "mid"),
+        ]
+        results = await tts.generate_interview_batch(items, voice_override="alloy")
+
+        assert len(results) == len(items), "Expected one result per batch item"
+        assert isinstance(results[1], ValueError), "Empty text should yield its ValueError"
+        successes = sum(1 for r in (results[0], results[2]) if isinstance(r, bytes) and len(r) > 0)
+        assert successes >= 1, f"Interview batch failures: {successes}/2"
+
     def test_should_speak_logic(self, tts):
         """should_speak_this() must correctly filter text for TTS."""
         test_cases = [